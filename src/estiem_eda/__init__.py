@@ -4,15 +4,25 @@ __version__ = "0.1.0"
 __author__ = "ESTIEM"
 __description__ = "MCP server for exploratory data analysis including I-charts, process capability, ANOVA, and Pareto analysis"
 
-# Import quick analysis for easy access
-from .quick_analysis import (
-    QuickEDA,
-    generate_sample_data,
-    quick_capability,
-    quick_i_chart,
-    quick_pareto,
+# Quick analysis helpers for easy access, imported on first use so that loading
+# the MCP server or a tool module does not pull in NumPy up front
+_QUICK_ANALYSIS_EXPORTS = (
+    "QuickEDA",
+    "generate_sample_data",
+    "quick_capability",
+    "quick_i_chart",
+    "quick_pareto",
 )
 
+
+def __getattr__(name):
+    if name in _QUICK_ANALYSIS_EXPORTS:
+        from . import quick_analysis
+
+        return getattr(quick_analysis, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "mcp_server",
     "tools",
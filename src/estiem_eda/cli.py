@@ -542,9 +542,8 @@ def pareto(data_file, category, value, output, format):
         click.echo(f"   Vital Few: {len(stats['categories'])} categories")
         click.echo(f"   Impact: {stats['percentage']:.1f}% of total")
 
-        sorted_categories = sorted(data_dict.items(), key=lambda x: x[1], reverse=True)
-        top_3 = [cat for cat, _ in sorted_categories[:3]]
-        click.echo(f"   Top 3: {', '.join(top_3)}")
+        # Categories come back already ranked, so no second sort is needed
+        click.echo(f"   Top 3: {', '.join(results['categories'][:3])}")
 
         click.echo(f"\n🎯 {results['interpretation']}")
 
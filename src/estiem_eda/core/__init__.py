@@ -6,9 +6,13 @@ Shared calculation engine for all platforms (MCP, Web, CLI, Colab)
 from .calculations import (
     calculate_anova,
     calculate_i_chart,
+    calculate_moments,
     calculate_pareto,
     calculate_probability_plot,
     calculate_process_capability,
+    calculate_process_capability_batch,
+    calculate_process_capability_update,
+    update_moments,
 )
 from .validation import validate_groups_data, validate_numeric_data, validate_pareto_data
 
@@ -18,6 +22,10 @@ __all__ = [
     "calculate_anova",
     "calculate_pareto",
     "calculate_probability_plot",
+    "calculate_moments",
+    "calculate_process_capability_batch",
+    "calculate_process_capability_update",
+    "update_moments",
     "validate_numeric_data",
     "validate_groups_data",
     "validate_pareto_data",
@@ -3,10 +3,23 @@ Pure NumPy/SciPy statistical calculations for ESTIEM EDA
 Shared calculation engine for all platforms (MCP, Web, CLI, Colab)
 """
 
+import bisect
+import math
+from functools import lru_cache
+from statistics import NormalDist
 from typing import Any
 
 import numpy as np
-from scipy import stats
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Standard normal for scalar tail calculations that do not need scipy
+STANDARD_NORMAL = NormalDist()
+
+# d2 bias-correction constant for moving ranges of 2 consecutive points
+D2_MOVING_RANGE = 1.128
+
+# Consecutive same-side points that trigger Western Electric rule 4
+WE_RUN_LENGTH = 8
 
 
 def calculate_i_chart(values: np.ndarray, title: str = "I-Chart Analysis") -> dict[str, Any]:
@@ -23,24 +36,20 @@ def calculate_i_chart(values: np.ndarray, title: str = "I-Chart Analysis") -> di
     n = len(values)
     mean = np.mean(values)
 
-    # Moving range for sigma estimation
-    moving_range = np.abs(np.diff(values))
+    # Moving range for sigma estimation (abs taken in place on the diff buffer)
+    moving_range = np.diff(values)
+    np.abs(moving_range, out=moving_range)
     avg_mr = np.mean(moving_range)
 
     # Control limits (using moving range method)
-    # d2 constant for n=2 (moving range of 2)
-    d2 = 1.128
-    sigma_hat = avg_mr / d2
+    sigma_hat = avg_mr / D2_MOVING_RANGE
 
     # Control limits for individuals (A2 = 3/sqrt(n) for n=1)
     ucl = mean + 3 * sigma_hat
     lcl = mean - 3 * sigma_hat
 
     # Check for out-of-control points
-    out_of_control = []
-    for i, value in enumerate(values):
-        if value > ucl or value < lcl:
-            out_of_control.append(i)
+    out_of_control = np.flatnonzero((values > ucl) | (values < lcl)).tolist()
 
     # Western Electric Rules
     violations = check_western_electric_rules(values, mean, ucl, lcl, sigma_hat)
@@ -69,7 +78,11 @@ def calculate_i_chart(values: np.ndarray, title: str = "I-Chart Analysis") -> di
 
 
 def calculate_process_capability(
-    values: np.ndarray, lsl: float, usl: float, target: float = None
+    values: np.ndarray,
+    lsl: float,
+    usl: float,
+    target: float = None,
+    moments: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     """
     Calculate process capability indices (Cp, Cpk, Pp, Ppk)
@@ -79,49 +92,61 @@ def calculate_process_capability(
         lsl: Lower specification limit
         usl: Upper specification limit
         target: Target value (defaults to center of spec limits)
+        moments: Precomputed calculate_moments() result for values, if the
+            caller already has one
 
     Returns:
         Dictionary with capability indices and defect analysis
     """
-    n = len(values)
-    mean = np.mean(values)
-    std_dev = np.std(values, ddof=1)  # Sample standard deviation
+    if moments is None:
+        moments = calculate_moments(values)
+    n = moments["sample_size"]
+    mean = moments["mean"]
+    std_dev = moments["std_dev"]  # Sample standard deviation
+    population_std = moments["population_std"]
 
     if target is None:
         target = (lsl + usl) / 2
 
-    # Capability indices
+    # Spec-derived distances shared by the indices and the defect analysis
     tolerance = usl - lsl
-    cp = tolerance / (6 * std_dev) if std_dev > 0 else float("inf")
-
-    cpu = (usl - mean) / (3 * std_dev) if std_dev > 0 else float("inf")
-    cpl = (mean - lsl) / (3 * std_dev) if std_dev > 0 else float("inf")
+    upper_margin = usl - mean
+    lower_margin = mean - lsl
+
+    # Capability indices and z-scores (sample standard deviation)
+    if std_dev > 0:
+        z_upper = upper_margin / std_dev
+        z_lower = -lower_margin / std_dev
+        cp = tolerance / (6 * std_dev)
+        cpu = z_upper / 3
+        cpl = -z_lower / 3
+    else:
+        z_upper = float("inf")
+        z_lower = -float("inf")
+        cp = cpu = cpl = float("inf")
     cpk = min(cpu, cpl)
 
     # Performance indices (using population standard deviation)
-    pp = tolerance / (6 * np.std(values, ddof=0)) if np.std(values, ddof=0) > 0 else float("inf")
-    ppu = (
-        (usl - mean) / (3 * np.std(values, ddof=0)) if np.std(values, ddof=0) > 0 else float("inf")
-    )
-    ppl = (
-        (mean - lsl) / (3 * np.std(values, ddof=0)) if np.std(values, ddof=0) > 0 else float("inf")
-    )
+    if population_std > 0:
+        pp = tolerance / (6 * population_std)
+        ppu = upper_margin / (3 * population_std)
+        ppl = lower_margin / (3 * population_std)
+    else:
+        pp = ppu = ppl = float("inf")
     ppk = min(ppu, ppl)
 
     # Defect analysis
-    z_lower = (lsl - mean) / std_dev if std_dev > 0 else -float("inf")
-    z_upper = (usl - mean) / std_dev if std_dev > 0 else float("inf")
 
-    ppm_lower = stats.norm.cdf(z_lower) * 1_000_000
-    ppm_upper = (1 - stats.norm.cdf(z_upper)) * 1_000_000
+    # Normal tail probabilities via erfc (also accurate far into the upper tail)
+    ppm_lower = 500_000 * math.erfc(-z_lower / math.sqrt(2))
+    ppm_upper = 500_000 * math.erfc(z_upper / math.sqrt(2))
     ppm_total = ppm_lower + ppm_upper
 
-    # Six Sigma level calculation
-    if ppm_total > 0:
-        z_shift = stats.norm.ppf(1 - ppm_total / 2_000_000)  # Two-sided
-        sigma_level = z_shift + 1.5  # Traditional 1.5 sigma shift
-    else:
-        sigma_level = 6.0
+    # Six Sigma level: two-sided z from the lower-tail inverse by symmetry (no 1 - p
+    # cancellation) plus the traditional 1.5 sigma shift. A tail probability that
+    # underflows to zero is treated like no defects at all.
+    tail_probability = ppm_total / 2_000_000
+    sigma_level = -STANDARD_NORMAL.inv_cdf(tail_probability) + 1.5 if tail_probability > 0 else 6.0
 
     return {
         "success": True,
@@ -154,40 +179,162 @@ def calculate_process_capability(
     }
 
 
-def calculate_anova(groups: dict[str, np.ndarray], alpha: float = 0.05) -> dict[str, Any]:
+def calculate_process_capability_update(
+    prior: dict[str, Any],
+    new_values: np.ndarray,
+    lsl: float,
+    usl: float,
+    target: float = None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Update process capability with new measurements without rescanning history
+
+    Args:
+        prior: calculate_moments()/update_moments() result for the earlier data
+        new_values: Array of new numeric measurements
+        lsl: Lower specification limit
+        usl: Upper specification limit
+        target: Target value (defaults to center of spec limits)
+
+    Returns:
+        Tuple of the capability results for all data and the updated moments,
+        which can be passed as prior for the next update
+    """
+    moments = update_moments(prior, np.asarray(new_values, dtype=np.float64))
+    return calculate_process_capability(None, lsl, usl, target, moments), moments
+
+
+def calculate_process_capability_batch(
+    data: np.ndarray,
+    lsl: float | np.ndarray,
+    usl: float | np.ndarray,
+    target: float | np.ndarray | None = None,
+) -> dict[str, Any]:
+    """
+    Calculate capability indices for many process streams at once
+
+    Each row of data is one stream. Spec limits and target may be scalars
+    shared by all streams or one value per stream.
+
+    Args:
+        data: 2D array of measurements with shape (streams, samples)
+        lsl: Lower specification limit(s)
+        usl: Upper specification limit(s)
+        target: Target value(s) (defaults to center of spec limits)
+
+    Returns:
+        Dictionary of per-stream lists with the capability indices and moments
+    """
+    data = np.asarray(data, dtype=np.float64)
+    if data.ndim != 2 or data.shape[1] < 2:
+        raise ValueError("Batch data must be a 2D array with at least 2 samples per stream")
+
+    lsl = np.asarray(lsl, dtype=np.float64)
+    usl = np.asarray(usl, dtype=np.float64)
+    target = (lsl + usl) / 2 if target is None else np.asarray(target, dtype=np.float64)
+
+    n = data.shape[1]
+    means = data.mean(axis=1)
+    sum_sq = np.square(data - means[:, None]).sum(axis=1)
+    std_dev = np.sqrt(sum_sq / (n - 1))
+    population_std = np.sqrt(sum_sq / n)
+
+    tolerance = usl - lsl
+    upper_margin = usl - means
+    lower_margin = means - lsl
+
+    # Zero spread gives infinite indices, as in the single-stream calculation
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sigma3 = np.where(std_dev > 0, 3 * std_dev, 0.0)
+        cp = np.where(std_dev > 0, tolerance / (2 * sigma3), np.inf)
+        cpu = np.where(std_dev > 0, upper_margin / sigma3, np.inf)
+        cpl = np.where(std_dev > 0, lower_margin / sigma3, np.inf)
+
+        population3 = np.where(population_std > 0, 3 * population_std, 0.0)
+        pp = np.where(population_std > 0, tolerance / (2 * population3), np.inf)
+        ppu = np.where(population_std > 0, upper_margin / population3, np.inf)
+        ppl = np.where(population_std > 0, lower_margin / population3, np.inf)
+
+    # Per-stream lists keep the result JSON-ready like the single-stream one
+    streams = means.shape
+
+    def per_stream(values: np.ndarray) -> list[float]:
+        return np.broadcast_to(values, streams).tolist()
+
+    return {
+        "success": True,
+        "capability_indices": {
+            "cp": per_stream(cp),
+            "cpk": per_stream(np.minimum(cpu, cpl)),
+            "cpu": per_stream(cpu),
+            "cpl": per_stream(cpl),
+            "pp": per_stream(pp),
+            "ppk": per_stream(np.minimum(ppu, ppl)),
+            "ppu": per_stream(ppu),
+            "ppl": per_stream(ppl),
+        },
+        "statistics": {
+            "sample_size": n,
+            "mean": per_stream(means),
+            "std_dev": per_stream(std_dev),
+            "lsl": per_stream(lsl),
+            "usl": per_stream(usl),
+            "target": per_stream(target),
+        },
+        "analysis_type": "capability_batch",
+    }
+
+
+def calculate_anova(
+    groups: dict[str, np.ndarray],
+    alpha: float = 0.05,
+    include_interpretation: bool = True,
+    include_boxplot: bool = False,
+    include_assumptions: bool = False,
+) -> dict[str, Any]:
     """
     Calculate one-way Analysis of Variance (ANOVA)
 
     Args:
         groups: Dictionary with group names as keys, data arrays as values
         alpha: Significance level
+        include_interpretation: Whether to generate the interpretation text
+        include_boxplot: Whether to add per-group boxplot summaries for charting
+        include_assumptions: Whether to run a normality test on every group
 
     Returns:
         Dictionary with ANOVA results and post-hoc comparisons
     """
-    list(groups.keys())
+    from scipy import stats
+
     group_data = list(groups.values())
 
     # Basic statistics
     k = len(groups)  # Number of groups
-    n_total = sum(len(group) for group in group_data)
 
-    # Grand mean
+    # Group sizes, means and squared deviations in vectorised passes over the
+    # concatenated data (one reduceat per moment instead of a loop per group)
     all_data = np.concatenate(group_data)
-    grand_mean = np.mean(all_data)
+    group_sizes = np.array([len(group) for group in group_data])
+    group_starts = np.concatenate(([0], np.cumsum(group_sizes)[:-1]))
+    group_sums = np.add.reduceat(all_data, group_starts)
+    group_means = group_sums / group_sizes
+    deviations = all_data - np.repeat(group_means, group_sizes)
+    group_ss = np.add.reduceat(deviations * deviations, group_starts)
 
-    # Group means and sizes
-    group_means = [np.mean(group) for group in group_data]
-    group_sizes = [len(group) for group in group_data]
+    # Grand mean from the group sums rather than another pass over the data
+    n_total = int(group_sizes.sum())
+    grand_mean = group_sums.sum() / n_total
 
     # Sum of squares
     # Between groups (SSB)
-    ssb = sum(
-        n * (mean - grand_mean) ** 2 for n, mean in zip(group_sizes, group_means, strict=False)
-    )
+    ssb = float(np.sum(group_sizes * (group_means - grand_mean) ** 2))
 
-    # Within groups (SSW)
-    ssw = sum(np.sum((group - np.mean(group)) ** 2) for group in group_data)
+    # Within groups (SSW) - per-group squared deviations are reused for the
+    # group standard deviations and post-hoc tests below
+    ssw = float(np.sum(group_ss))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        group_stds = np.sqrt(group_ss / (group_sizes - 1))
 
     # Total sum of squares
     sst = ssb + ssw
@@ -195,7 +342,6 @@ def calculate_anova(groups: dict[str, np.ndarray], alpha: float = 0.05) -> dict[
     # Degrees of freedom
     df_between = k - 1
     df_within = n_total - k
-    n_total - 1
 
     # Mean squares
     msb = ssb / df_between if df_between > 0 else 0
@@ -204,8 +350,8 @@ def calculate_anova(groups: dict[str, np.ndarray], alpha: float = 0.05) -> dict[
     # F-statistic
     f_statistic = msb / msw if msw > 0 else float("inf")
 
-    # p-value
-    p_value = 1 - stats.f.cdf(f_statistic, df_between, df_within)
+    # p-value (survival function keeps precision in the upper tail)
+    p_value = stats.f.sf(f_statistic, df_between, df_within)
 
     # Significance
     significant = p_value < alpha
@@ -219,14 +365,21 @@ def calculate_anova(groups: dict[str, np.ndarray], alpha: float = 0.05) -> dict[
             for i in range(len(group_names_list)):
                 for j in range(i + 1, len(group_names_list)):
                     name1, name2 = group_names_list[i], group_names_list[j]
-                    # Simple t-test between pairs
-                    t_stat, p_val = stats.ttest_ind(groups[name1], groups[name2])
+                    # Simple t-test between pairs from the precomputed moments
+                    t_stat, p_val = stats.ttest_ind_from_stats(
+                        group_means[i],
+                        group_stds[i],
+                        group_sizes[i],
+                        group_means[j],
+                        group_stds[j],
+                        group_sizes[j],
+                    )
                     comparisons.append(
                         {
                             "groups": f"{name1} vs {name2}",
                             "p_value": p_val,
                             "significant": p_val < alpha,
-                            "mean_diff": np.mean(groups[name2]) - np.mean(groups[name1]),
+                            "mean_diff": group_means[j] - group_means[i],
                         }
                     )
             post_hoc = {"comparisons": comparisons, "method": "Simple pairwise t-tests"}
@@ -249,14 +402,28 @@ def calculate_anova(groups: dict[str, np.ndarray], alpha: float = 0.05) -> dict[
             "msw": msw,
         },
         "group_statistics": {
-            name: {"mean": np.mean(data), "std": np.std(data, ddof=1), "size": len(data)}
-            for name, data in groups.items()
+            name: {"mean": mean, "std": std, "size": int(size)}
+            for name, mean, std, size in zip(
+                groups, group_means, group_stds, group_sizes, strict=False
+            )
         },
         "grand_mean": grand_mean,
-        "interpretation": interpret_anova(f_statistic, p_value, significant, k),
         "analysis_type": "anova",
     }
 
+    if include_interpretation:
+        results["interpretation"] = interpret_anova(f_statistic, p_value, significant, k)
+
+    if include_boxplot:
+        results["boxplot_data"] = {
+            name: calculate_boxplot_summary(data) for name, data in groups.items()
+        }
+
+    if include_assumptions:
+        results["assumptions"] = {
+            "normality": {name: check_group_normality(data, alpha) for name, data in groups.items()}
+        }
+
     if post_hoc:
         results["post_hoc"] = post_hoc
 
@@ -277,40 +444,31 @@ def calculate_pareto(data: dict[str, float], threshold: float = 0.8) -> dict[str
     if not data:
         raise ValueError("Empty data provided for Pareto analysis")
 
-    # Sort by value (descending)
-    sorted_items = sorted(data.items(), key=lambda x: x[1], reverse=True)
+    # Sort by value (descending); the stable sort keeps ties in input order
+    category_names = list(data)
+    raw_values = np.fromiter(data.values(), dtype=np.float64, count=len(data))
+    order = np.argsort(-raw_values, kind="stable")
+    sorted_values = raw_values[order]
 
     # Calculate percentages and cumulative percentages
-    total = sum(data.values())
-
-    categories = []
-    values = []
-    percentages = []
-    cumulative_percentages = []
-
-    cumulative = 0
-    for category, value in sorted_items:
-        categories.append(category)
-        values.append(value)
-
-        percentage = (value / total) * 100
-        percentages.append(percentage)
+    total = float(sorted_values.sum())
+    percentage_array = sorted_values / total * 100
+    cumulative_array = np.cumsum(percentage_array)
 
-        cumulative += percentage
-        cumulative_percentages.append(cumulative)
+    categories = [category_names[i] for i in order.tolist()]
+    values = sorted_values.tolist()
+    percentages = percentage_array.tolist()
+    cumulative_percentages = cumulative_array.tolist()
 
-    # Find vital few (categories contributing to threshold% of total)
-    vital_few_indices = []
-    for i, cum_pct in enumerate(cumulative_percentages):
-        vital_few_indices.append(i)
-        if cum_pct >= threshold * 100:
-            break
+    # Find vital few (categories up to and including the one reaching threshold%)
+    reached = np.flatnonzero(cumulative_array >= threshold * 100)
+    vital_count = int(reached[0]) + 1 if reached.size else len(categories)
 
-    vital_few_categories = [categories[i] for i in vital_few_indices]
-    vital_few_percentage = cumulative_percentages[vital_few_indices[-1]]
+    vital_few_categories = categories[:vital_count]
+    vital_few_percentage = cumulative_percentages[vital_count - 1]
 
-    # Calculate Gini coefficient
-    gini = calculate_gini_coefficient(values)
+    # Calculate Gini coefficient, reusing the descending sort and the total
+    gini = _gini_from_sorted(sorted_values[::-1], total)
 
     return {
         "success": True,
@@ -346,6 +504,8 @@ def calculate_probability_plot(
     Returns:
         Dictionary with probability plot results and goodness of fit
     """
+    from scipy import stats
+
     n = len(values)
     sorted_values = np.sort(values)
 
@@ -354,12 +514,12 @@ def calculate_probability_plot(
 
     # Transform data based on distribution
     if distribution == "normal":
-        theoretical_quantiles = stats.norm.ppf(plotting_positions)
+        theoretical_quantiles = normal_plotting_quantiles(n)
         transformed_data = sorted_values
     elif distribution == "lognormal":
         if np.any(sorted_values <= 0):
             raise ValueError("Lognormal distribution requires positive values")
-        theoretical_quantiles = stats.norm.ppf(plotting_positions)
+        theoretical_quantiles = normal_plotting_quantiles(n)
         transformed_data = np.log(sorted_values)
     elif distribution == "weibull":
         if np.any(sorted_values <= 0):
@@ -378,21 +538,13 @@ def calculate_probability_plot(
         theoretical_quantiles, transformed_data
     )
 
-    # Calculate confidence intervals
-    alpha = 1 - confidence_level
-    stats.t.ppf(1 - alpha / 2, n - 2)
-
     # Prediction intervals for new observations
     residuals = transformed_data - (slope * theoretical_quantiles + intercept)
     s_res = np.std(residuals, ddof=2)
 
     # Calculate outliers (points outside confidence bands)
-    outliers = []
-    for i in range(n):
-        expected = slope * theoretical_quantiles[i] + intercept
-        deviation = abs(transformed_data[i] - expected)
-        if deviation > 2 * s_res:  # Simple outlier detection
-            outliers.append(i)
+    outlier_mask = np.abs(residuals) > 2 * s_res  # Simple outlier detection
+    outliers = np.flatnonzero(outlier_mask).tolist()
 
     # Normality tests
     if distribution == "normal":
@@ -425,7 +577,7 @@ def calculate_probability_plot(
         "outliers": {
             "indices": outliers,
             "count": len(outliers),
-            "values": [sorted_values[i] for i in outliers],
+            "values": sorted_values[outlier_mask].tolist(),
         },
         "confidence_level": confidence_level,
         "normality_test": normality_test,
@@ -441,99 +593,264 @@ def check_western_electric_rules(
     values: np.ndarray, mean: float, ucl: float, lcl: float, sigma: float
 ) -> list[dict[str, Any]]:
     """Check Western Electric rules for control chart violations"""
+    values = np.asarray(values)
     violations = []
-    n = len(values)
 
     # Rule 1: Point beyond control limits (already checked in main function)
 
-    # Rule 2: 2 out of 3 consecutive points beyond 2-sigma
-    two_sigma_upper = mean + 2 * sigma
-    two_sigma_lower = mean - 2 * sigma
+    # Boolean buffers reused by both sigma-zone rules instead of fresh masks per rule
+    beyond = np.empty(values.shape, dtype=bool)
+    scratch = np.empty(values.shape, dtype=bool)
 
-    for i in range(n - 2):
-        beyond_2sigma = sum(
-            1 for j in range(i, i + 3) if values[j] > two_sigma_upper or values[j] < two_sigma_lower
+    # Rule 2: 2 out of 3 consecutive points beyond 2-sigma
+    np.greater(values, mean + 2 * sigma, out=beyond)
+    np.logical_or(beyond, np.less(values, mean - 2 * sigma, out=scratch), out=beyond)
+    for i in _window_starts_with_count(beyond, 3, 2):
+        violations.append(
+            {
+                "rule": 2,
+                "description": "2 out of 3 points beyond 2-sigma",
+                "points": list(range(i, i + 3)),
+            }
         )
-        if beyond_2sigma >= 2:
-            violations.append(
-                {
-                    "rule": 2,
-                    "description": "2 out of 3 points beyond 2-sigma",
-                    "points": list(range(i, i + 3)),
-                }
-            )
 
     # Rule 3: 4 out of 5 consecutive points beyond 1-sigma
-    one_sigma_upper = mean + sigma
-    one_sigma_lower = mean - sigma
-
-    for i in range(n - 4):
-        beyond_1sigma = sum(
-            1 for j in range(i, i + 5) if values[j] > one_sigma_upper or values[j] < one_sigma_lower
+    np.greater(values, mean + sigma, out=beyond)
+    np.logical_or(beyond, np.less(values, mean - sigma, out=scratch), out=beyond)
+    for i in _window_starts_with_count(beyond, 5, 4):
+        violations.append(
+            {
+                "rule": 3,
+                "description": "4 out of 5 points beyond 1-sigma",
+                "points": list(range(i, i + 5)),
+            }
         )
-        if beyond_1sigma >= 4:
-            violations.append(
-                {
-                    "rule": 3,
-                    "description": "4 out of 5 points beyond 1-sigma",
-                    "points": list(range(i, i + 5)),
-                }
-            )
 
-    # Rule 4: 8 consecutive points on one side of center line
-    for i in range(n - 7):
-        all_above = all(values[j] > mean for j in range(i, i + 8))
-        all_below = all(values[j] < mean for j in range(i, i + 8))
-        if all_above or all_below:
+    # Rule 4: 8 consecutive points on one side of center line; every window of 8
+    # inside a run of same-side points is a violation
+    run_starts, run_lengths, run_sides = run_length_encode(np.sign(values - mean))
+    long_runs = (run_sides != 0) & (run_lengths >= WE_RUN_LENGTH)
+    for start, length in zip(run_starts[long_runs], run_lengths[long_runs], strict=True):
+        for i in range(int(start), int(start + length) - WE_RUN_LENGTH + 1):
             violations.append(
                 {
                     "rule": 4,
                     "description": "8 consecutive points on one side of center line",
-                    "points": list(range(i, i + 8)),
+                    "points": list(range(i, i + WE_RUN_LENGTH)),
                 }
             )
 
     return violations
 
 
+def _window_starts_with_count(mask: np.ndarray, window: int, min_count: int) -> list[int]:
+    """
+    Find the windows of a boolean mask containing at least min_count True values
+
+    Args:
+        mask: 1D boolean array, e.g. points beyond a sigma limit
+        window: Number of consecutive points per window
+        min_count: Minimum number of flagged points for a window to match
+
+    Returns:
+        Start indices of the matching windows
+    """
+    # In-control data rarely has enough flagged points for any window to match
+    if len(mask) < window or np.count_nonzero(mask) < min_count:
+        return []
+    counts = sliding_window_view(mask.view(np.int8), window).sum(axis=1)
+    return np.flatnonzero(counts >= min_count).tolist()
+
+
+def run_length_encode(labels: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Split a 1D array into runs of equal consecutive values
+
+    Args:
+        labels: 1D array of labels, e.g. the side of the center line per point
+
+    Returns:
+        Tuple of run start indices, run lengths and the label of each run
+    """
+    labels = np.asarray(labels)
+    change = np.ones(len(labels) + 1, dtype=bool)
+    change[1:-1] = labels[1:] != labels[:-1]
+    boundaries = np.flatnonzero(change)
+    starts = boundaries[:-1]
+    return starts, np.diff(boundaries), labels[starts]
+
+
+def calculate_boxplot_summary(values: np.ndarray) -> dict[str, Any]:
+    """Five-number summary with Tukey fences for rendering a boxplot.
+
+    Only the summary and the outlying points are returned so that responses do
+    not carry a copy of every raw observation.
+    """
+    sorted_values = np.sort(values)
+    q1, median, q3 = np.percentile(sorted_values, [25, 50, 75])
+    iqr = q3 - q1
+    lower_fence = q1 - 1.5 * iqr
+    upper_fence = q3 + 1.5 * iqr
+
+    # Fence positions in the sorted array bound the outliers without a mask pass
+    lo_idx = np.searchsorted(sorted_values, lower_fence, side="left")
+    hi_idx = np.searchsorted(sorted_values, upper_fence, side="right")
+    outliers = np.concatenate([sorted_values[:lo_idx], sorted_values[hi_idx:]])
+
+    return {
+        "q1": q1,
+        "median": median,
+        "q3": q3,
+        "iqr": iqr,
+        "min": sorted_values[0],
+        "max": sorted_values[-1],
+        "lower_whisker": sorted_values[lo_idx],
+        "upper_whisker": sorted_values[hi_idx - 1],
+        "outliers": outliers.tolist(),
+        "mean": np.mean(values),
+    }
+
+
+def calculate_moments(values: np.ndarray) -> dict[str, Any]:
+    """Descriptive moments and range of a sample from one deviation pass.
+
+    Args:
+        values: Array of numeric measurements
+
+    Returns:
+        Dictionary with sample size, mean, sum of squared deviations, sample and
+        population standard deviations, minimum and maximum
+    """
+    n = len(values)
+    mean = float(np.mean(values))
+    deviations = values - mean
+    sum_sq = float(np.dot(deviations, deviations))
+
+    return {
+        "sample_size": n,
+        "mean": mean,
+        "sum_sq": sum_sq,
+        "std_dev": math.sqrt(sum_sq / (n - 1)) if n > 1 else float("nan"),
+        "population_std": math.sqrt(sum_sq / n),
+        "minimum": float(np.min(values)),
+        "maximum": float(np.max(values)),
+    }
+
+
+def update_moments(prior: dict[str, Any], new_values: np.ndarray) -> dict[str, Any]:
+    """Combine earlier moments with a batch of new values (Chan et al. parallel update).
+
+    Args:
+        prior: calculate_moments() result for the earlier data
+        new_values: Array of new numeric measurements
+
+    Returns:
+        Moments for the earlier and new data together, in the calculate_moments() format
+    """
+    if len(new_values) == 0:
+        return dict(prior)
+
+    batch = calculate_moments(new_values)
+    n_a, n_b = prior["sample_size"], batch["sample_size"]
+    if n_a == 0:
+        return batch
+
+    n = n_a + n_b
+    delta = batch["mean"] - prior["mean"]
+    mean = prior["mean"] + delta * n_b / n
+    sum_sq = prior["sum_sq"] + batch["sum_sq"] + delta * delta * n_a * n_b / n
+
+    return {
+        "sample_size": n,
+        "mean": mean,
+        "sum_sq": sum_sq,
+        "std_dev": math.sqrt(sum_sq / (n - 1)),
+        "population_std": math.sqrt(sum_sq / n),
+        "minimum": min(prior["minimum"], batch["minimum"]),
+        "maximum": max(prior["maximum"], batch["maximum"]),
+    }
+
+
+@lru_cache(maxsize=256)
+def normal_plotting_quantiles(n: int) -> np.ndarray:
+    """Standard normal quantiles at the median-rank plotting positions for n points.
+
+    The quantiles depend only on the sample size, so they are cached. The
+    returned array is read-only because it is shared between calls.
+    """
+    from scipy import stats
+
+    quantiles = stats.norm.ppf((np.arange(n) + 0.5) / n)
+    quantiles.flags.writeable = False
+    return quantiles
+
+
+# Shapiro-Wilk becomes slow and over-sensitive on very large samples
+SHAPIRO_MAX_SAMPLE_SIZE = 5000
+
+
+def check_group_normality(values: np.ndarray, alpha: float = 0.05) -> dict[str, Any]:
+    """Normality check for a single ANOVA group.
+
+    Uses Shapiro-Wilk up to SHAPIRO_MAX_SAMPLE_SIZE observations and
+    D'Agostino's K-squared test above that. Groups with fewer than three
+    observations are not tested.
+    """
+    from scipy import stats
+
+    n = len(values)
+    if n < 3:
+        return {"test_used": None, "statistic": None, "p_value": None, "normal": None}
+
+    if n > SHAPIRO_MAX_SAMPLE_SIZE:
+        statistic, p_value = stats.normaltest(values)
+        test_used = "D'Agostino K-squared"
+    else:
+        statistic, p_value = stats.shapiro(values)
+        test_used = "Shapiro-Wilk"
+
+    return {
+        "test_used": test_used,
+        "statistic": float(statistic),
+        "p_value": float(p_value),
+        "normal": bool(p_value >= alpha),
+    }
+
+
 def calculate_gini_coefficient(values: list[float]) -> float:
     """Calculate Gini coefficient for inequality measurement"""
-    sorted_values = sorted(values)
+    return _gini_from_sorted(np.sort(np.asarray(values, dtype=np.float64)))
+
+
+def _gini_from_sorted(sorted_values: np.ndarray, total: float | None = None) -> float:
+    """Gini coefficient of values already sorted in ascending order.
+
+    Uses the rank form G = (2 * sum(i * x_i) - (n + 1) * sum(x_i)) / (n * sum(x_i)).
+    Callers that already summed the values can pass the sum as total.
+    """
     n = len(sorted_values)
 
     if n == 0:
         return 0
 
-    # Calculate Gini coefficient
-    total = sum(sorted_values)
+    if total is None:
+        total = float(sorted_values.sum())
     if total == 0:
         return 0
 
-    gini_sum = sum((2 * (i + 1) - n - 1) * value for i, value in enumerate(sorted_values))
-    gini = gini_sum / (n * total)
+    ranks = np.arange(1, n + 1, dtype=np.float64)
+    return (2 * float(np.dot(ranks, sorted_values)) - (n + 1) * total) / (n * total)
 
-    return gini
+
+# Anderson-Darling statistic breakpoints and the p-value estimated below each one
+AD_STATISTIC_THRESHOLDS = (0.2, 0.34, 0.47, 0.64, 0.78, 0.91, 1.09)
+AD_P_VALUES = (0.8, 0.5, 0.25, 0.1, 0.05, 0.025, 0.01, 0.005)
 
 
 def estimate_anderson_darling_p_value(statistic: float, n: int) -> float:
     """Estimate p-value for Anderson-Darling test"""
-    # Simplified p-value estimation
-    if statistic < 0.2:
-        return 0.8
-    elif statistic < 0.34:
-        return 0.5
-    elif statistic < 0.47:
-        return 0.25
-    elif statistic < 0.64:
-        return 0.1
-    elif statistic < 0.78:
-        return 0.05
-    elif statistic < 0.91:
-        return 0.025
-    elif statistic < 1.09:
-        return 0.01
-    else:
-        return 0.005
+    # Simplified p-value estimation from a sorted threshold table
+    return AD_P_VALUES[bisect.bisect_right(AD_STATISTIC_THRESHOLDS, statistic)]
 
 
 # Interpretation functions
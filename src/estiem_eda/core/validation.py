@@ -164,21 +164,30 @@ def validate_pareto_data(data: dict[str, int | float] | list[dict]) -> dict[str,
     if not data:
         raise ValueError("Empty data provided")
 
-    # Validate and convert values
-    validated_data = {}
-    for category, value in data.items():
-        try:
-            val = float(value)
-            if val < 0:
-                raise ValueError(f"Negative value for category '{category}': {val}")
-            validated_data[str(category)] = val
-        except (ValueError, TypeError) as e:
-            raise ValueError(f"Invalid value for category '{category}': {e}")
-
-    if sum(validated_data.values()) == 0:
+    # Convert and range-check all values at once; the per-category loop only
+    # runs when a value fails, to report which category it belongs to (None
+    # also ends up here, since it converts to NaN)
+    try:
+        values = np.fromiter(data.values(), dtype=np.float64, count=len(data))
+    except (ValueError, TypeError):
+        values = None
+
+    if values is None or not np.all(values >= 0):
+        converted = []
+        for category, value in data.items():
+            try:
+                val = float(value)
+                if val < 0:
+                    raise ValueError(f"Negative value for category '{category}': {val}")
+                converted.append(val)
+            except (ValueError, TypeError) as e:
+                raise ValueError(f"Invalid value for category '{category}': {e}")
+        values = np.array(converted, dtype=np.float64)
+
+    if values.sum() == 0:
         raise ValueError("All category values are zero")
 
-    return validated_data
+    return dict(zip(map(str, data), values.tolist(), strict=True))
 
 
 def extract_column_data(data: list[dict] | dict, column_name: str) -> np.ndarray:
@@ -9,20 +9,14 @@ import logging
 import sys
 from typing import Any
 
-import numpy as np
-
 
 class MCPJSONEncoder(json.JSONEncoder):
     """Custom JSON encoder for MCP responses."""
 
     def default(self, obj):
-        if isinstance(obj, np.bool_):
-            return bool(obj)
-        elif isinstance(obj, np.integer):
-            return int(obj)
-        elif isinstance(obj, np.floating):
-            return float(obj)
-        elif isinstance(obj, np.ndarray):
+        # NumPy arrays and scalars convert to native Python values via tolist(),
+        # so the server module itself does not need to import NumPy
+        if hasattr(obj, "tolist"):
             return obj.tolist()
         return super().default(obj)
 
@@ -45,6 +39,15 @@ class ESTIEMMCPServer:
         self.setup_logging()
         self.initialize_tools()
 
+        # Method dispatch table, built once rather than on every request
+        self.handlers = {
+            "initialize": self.handle_initialize,
+            "initialized": self.handle_initialized,
+            "tools/list": self.handle_list_tools,
+            "tools/call": self.handle_call_tool,
+            "notifications/cancelled": self.handle_cancelled,
+        }
+
     def setup_logging(self) -> None:
         """Configure logging to stderr to not interfere with stdio."""
         logging.basicConfig(
@@ -95,15 +98,7 @@ class ESTIEMMCPServer:
 
         self.logger.debug(f"Handling request: method={method}")
 
-        handlers = {
-            "initialize": self.handle_initialize,
-            "initialized": self.handle_initialized,
-            "tools/list": self.handle_list_tools,
-            "tools/call": self.handle_call_tool,
-            "notifications/cancelled": self.handle_cancelled,
-        }
-
-        handler = handlers.get(method)
+        handler = self.handlers.get(method)
         if handler:
             try:
                 return handler(params)
@@ -219,6 +214,14 @@ class ESTIEMMCPServer:
             result = self.tools[tool_name].execute(arguments)
             self.logger.debug(f"Tool {tool_name} executed successfully")
 
+            # Skip chart rendering when the client only wants the statistics
+            if not arguments.get("include_visualization", True):
+                return {
+                    "content": [
+                        {"type": "text", "text": json.dumps(result, indent=2, cls=MCPJSONEncoder)}
+                    ]
+                }
+
             # Create simplified visualization response
             from .utils.simplified_visualization import SimplifiedVisualizationResponse
 
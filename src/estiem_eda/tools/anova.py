@@ -6,9 +6,7 @@ including post-hoc Tukey HSD analysis when significant differences are found.
 
 from typing import Any
 
-from ..core.calculations import calculate_anova
-from ..core.validation import validate_groups_data
-from .simplified_base import SimplifiedMCPTool
+from .simplified_base import INCLUDE_VISUALIZATION_PROPERTY, SimplifiedMCPTool
 
 
 class ANOVATool(SimplifiedMCPTool):
@@ -21,6 +19,50 @@ class ANOVATool(SimplifiedMCPTool):
     - Group statistics summary
     """
 
+    # Built once; the schema is read-only for MCP tool listing
+    _INPUT_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "groups": {
+                "type": "object",
+                "description": "Dictionary with group names as keys and data arrays as values",
+                "additionalProperties": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "minItems": 2,
+                    "maxItems": 1000,
+                },
+                "minProperties": 2,
+                "maxProperties": 20,
+            },
+            "alpha": {
+                "type": "number",
+                "minimum": 0.001,
+                "maximum": 0.1,
+                "default": 0.05,
+                "description": "Significance level (default 0.05)",
+            },
+            "title": {
+                "type": "string",
+                "description": "Optional title for the analysis",
+                "maxLength": 100,
+                "default": "ANOVA Analysis",
+            },
+            "include_visualization": INCLUDE_VISUALIZATION_PROPERTY,
+            "include_interpretation": {
+                "type": "boolean",
+                "default": True,
+                "description": "Include the text interpretation in the results",
+            },
+            "include_assumptions": {
+                "type": "boolean",
+                "default": False,
+                "description": "Test each group for normality (adds a test per group)",
+            },
+        },
+        "required": ["groups"],
+    }
+
     def __init__(self):
         """Initialize the ANOVA tool."""
         super().__init__(
@@ -30,40 +72,12 @@ class ANOVATool(SimplifiedMCPTool):
 
     def get_input_schema(self) -> dict[str, Any]:
         """Return the JSON schema for tool inputs."""
-        return {
-            "type": "object",
-            "properties": {
-                "groups": {
-                    "type": "object",
-                    "description": "Dictionary with group names as keys and data arrays as values",
-                    "additionalProperties": {
-                        "type": "array",
-                        "items": {"type": "number"},
-                        "minItems": 2,
-                        "maxItems": 1000,
-                    },
-                    "minProperties": 2,
-                    "maxProperties": 20,
-                },
-                "alpha": {
-                    "type": "number",
-                    "minimum": 0.001,
-                    "maximum": 0.1,
-                    "default": 0.05,
-                    "description": "Significance level (default 0.05)",
-                },
-                "title": {
-                    "type": "string",
-                    "description": "Optional title for the analysis",
-                    "maxLength": 100,
-                    "default": "ANOVA Analysis",
-                },
-            },
-            "required": ["groups"],
-        }
+        return self._INPUT_SCHEMA
 
     def validate_arguments(self, arguments: dict[str, Any]) -> dict[str, Any]:
         """Validate ANOVA-specific arguments."""
+        import numpy as np
+
         if not isinstance(arguments, dict):
             raise ValueError("Arguments must be a dictionary")
 
@@ -80,7 +94,14 @@ class ANOVATool(SimplifiedMCPTool):
                 if not isinstance(group_data, list):
                     raise ValueError(f"Group '{group_name}' must be a list of numbers")
 
-                # Validate numeric data
+                # Validate numeric data - a flat numeric dtype needs no per-item check
+                try:
+                    array = np.asarray(group_data)
+                except (ValueError, TypeError):
+                    raise ValueError(f"Group '{group_name}' contains non-numeric data")
+                if array.ndim == 1 and array.dtype.kind in "biuf":
+                    continue
+
                 for item in group_data:
                     try:
                         float(item)
@@ -90,7 +111,13 @@ class ANOVATool(SimplifiedMCPTool):
             validated["groups"] = groups
 
         # Validate other parameters
-        for param in ["alpha", "title"]:
+        for param in [
+            "alpha",
+            "title",
+            "include_visualization",
+            "include_interpretation",
+            "include_assumptions",
+        ]:
             if param in arguments:
                 validated[param] = arguments[param]
 
@@ -105,19 +132,37 @@ class ANOVATool(SimplifiedMCPTool):
         Returns:
             Statistical analysis results
         """
+        from ..core.calculations import calculate_anova
+        from ..core.validation import validate_groups_data
+
         # Extract parameters
         groups_data = arguments.get("groups", {})
         alpha = arguments.get("alpha", 0.05)
+        include_interpretation = arguments.get("include_interpretation", True)
+        # Boxplot summaries are only needed to draw the chart
+        include_boxplot = arguments.get("include_visualization", True)
         arguments.get("title", "ANOVA Analysis")
 
         # Validate groups data
         validated_groups = validate_groups_data(groups_data)
 
         # Use core calculation engine
-        results = calculate_anova(validated_groups, alpha)
+        results = calculate_anova(
+            validated_groups,
+            alpha,
+            include_interpretation,
+            include_boxplot,
+            include_assumptions=arguments.get("include_assumptions", False),
+        )
 
         # Format statistics for consistent output
-        for key in ["group_statistics", "anova_results", "effect_size"]:
+        for key in [
+            "group_statistics",
+            "anova_results",
+            "effect_size",
+            "boxplot_data",
+            "assumptions",
+        ]:
             if key in results:
                 results[key] = self.format_statistics(results[key])
 
@@ -1,7 +1,10 @@
 """Base class for all statistical tools in ESTIEM EDA toolkit."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class BaseTool(ABC):
@@ -52,32 +55,46 @@ class BaseTool(ABC):
         Raises:
             ValueError: If any required parameters are missing.
         """
-        missing = [p for p in required if p not in params]
+        missing = sorted(set(required).difference(params))
         if missing:
             raise ValueError(f"Missing required parameters: {missing}")
 
-    def validate_data_array(self, data: list[float], min_length: int = 1) -> None:
+    def validate_data_array(self, data: list[float], min_length: int = 1) -> "np.ndarray":
         """Validate data array input.
 
         Args:
             data: List of numerical data points.
             min_length: Minimum required length for the data array.
 
+        Returns:
+            The validated data as a one-dimensional float64 array.
+
         Raises:
-            ValueError: If data is invalid (empty, too short, contains non-numeric values).
+            ValueError: If data is invalid (empty, too short, contains non-numeric
+                or non-finite values).
         """
-        if not data:
-            raise ValueError("Data array cannot be empty")
-
-        if len(data) < min_length:
-            raise ValueError(f"Data array must contain at least {min_length} points")
+        import numpy as np
 
         try:
-            # Attempt to convert to float to validate numeric data
-            [float(x) for x in data]
+            # Single vectorised conversion validates every element at once
+            arr = np.asarray(data, dtype=np.float64)
         except (ValueError, TypeError):
             raise ValueError("Data array must contain only numeric values")
 
+        if arr.ndim != 1:
+            raise ValueError("Data array must be one-dimensional")
+
+        if arr.size == 0:
+            raise ValueError("Data array cannot be empty")
+
+        if arr.size < min_length:
+            raise ValueError(f"Data array must contain at least {min_length} points")
+
+        if not np.isfinite(arr).all():
+            raise ValueError("Data array must contain only finite values")
+
+        return arr
+
 
 # Alias for MCP compatibility
 BaseMCPTool = BaseTool
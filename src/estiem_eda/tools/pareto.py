@@ -6,9 +6,7 @@ most significantly to problems or outcomes.
 
 from typing import Any
 
-from ..core.calculations import calculate_pareto
-from ..core.validation import validate_pareto_data
-from .simplified_base import SimplifiedMCPTool
+from .simplified_base import INCLUDE_VISUALIZATION_PROPERTY, SimplifiedMCPTool
 
 
 class ParetoTool(SimplifiedMCPTool):
@@ -21,6 +19,35 @@ class ParetoTool(SimplifiedMCPTool):
     - Category ranking and analysis
     """
 
+    # Built once; the schema is read-only for MCP tool listing
+    _INPUT_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "data": {
+                "type": "object",
+                "description": "Dictionary with categories as keys and values as values",
+                "additionalProperties": {"type": "number", "minimum": 0},
+                "minProperties": 2,
+                "maxProperties": 50,
+            },
+            "threshold": {
+                "type": "number",
+                "minimum": 0.5,
+                "maximum": 0.99,
+                "default": 0.8,
+                "description": "Threshold for vital few identification (default 0.8 for 80%)",
+            },
+            "include_visualization": INCLUDE_VISUALIZATION_PROPERTY,
+            "title": {
+                "type": "string",
+                "description": "Optional title for the analysis",
+                "maxLength": 100,
+                "default": "Pareto Analysis",
+            },
+        },
+        "required": ["data"],
+    }
+
     def __init__(self):
         """Initialize the Pareto Analysis tool."""
         super().__init__(
@@ -30,32 +57,7 @@ class ParetoTool(SimplifiedMCPTool):
 
     def get_input_schema(self) -> dict[str, Any]:
         """Return the JSON schema for tool inputs."""
-        return {
-            "type": "object",
-            "properties": {
-                "data": {
-                    "type": "object",
-                    "description": "Dictionary with categories as keys and values as values",
-                    "additionalProperties": {"type": "number", "minimum": 0},
-                    "minProperties": 2,
-                    "maxProperties": 50,
-                },
-                "threshold": {
-                    "type": "number",
-                    "minimum": 0.5,
-                    "maximum": 0.99,
-                    "default": 0.8,
-                    "description": "Threshold for vital few identification (default 0.8 for 80%)",
-                },
-                "title": {
-                    "type": "string",
-                    "description": "Optional title for the analysis",
-                    "maxLength": 100,
-                    "default": "Pareto Analysis",
-                },
-            },
-            "required": ["data"],
-        }
+        return self._INPUT_SCHEMA
 
     def validate_arguments(self, arguments: dict[str, Any]) -> dict[str, Any]:
         """Validate Pareto-specific arguments."""
@@ -95,6 +97,9 @@ class ParetoTool(SimplifiedMCPTool):
         Returns:
             Statistical analysis results
         """
+        from ..core.calculations import calculate_pareto
+        from ..core.validation import validate_pareto_data
+
         # Extract parameters
         data = arguments.get("data", {})
         threshold = arguments.get("threshold", 0.8)
@@ -9,14 +9,19 @@ three related statistical analyses for a single measurement variable:
 
 from typing import Any
 
-import numpy as np
+from .simplified_base import INCLUDE_VISUALIZATION_PROPERTY, SimplifiedMCPTool
 
-from ..core.calculations import (
-    calculate_i_chart,
-    calculate_probability_plot,
-    calculate_process_capability,
-)
-from .simplified_base import SimplifiedMCPTool
+# Cpk thresholds shared by the interpretation and the overall assessment
+CPK_CAPABLE = 1.33
+CPK_MARGINAL = 1.0
+
+CAPABILITY_MESSAGES = {
+    "capable": "Process is capable (Cpk = {cpk:.3f}) and meets specification requirements.",
+    "marginal": "Process has marginal capability (Cpk = {cpk:.3f}) and may need improvement.",
+    "not_capable": (
+        "Process is not capable (Cpk = {cpk:.3f}) and requires significant improvement."
+    ),
+}
 
 
 class ProcessAnalysisTool(SimplifiedMCPTool):
@@ -30,6 +35,64 @@ class ProcessAnalysisTool(SimplifiedMCPTool):
     All analyses are performed on the same selected measurement variable.
     """
 
+    # Built once; the schema is read-only for MCP tool listing
+    _INPUT_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "data": {
+                "type": "array",
+                "items": {"type": "number"},
+                "description": "Array of measurement values for comprehensive process analysis",
+                "minItems": 10,
+                "maxItems": 10000,
+            },
+            "data_b64": {
+                "type": "string",
+                "contentEncoding": "base64",
+                "description": (
+                    "Alternative to data: base64-encoded little-endian float64 measurement values"
+                ),
+            },
+            "title": {
+                "type": "string",
+                "description": "Optional title for the analysis",
+                "default": "Process Analysis",
+            },
+            "specification_limits": {
+                "type": "object",
+                "properties": {
+                    "lsl": {"type": "number", "description": "Lower specification limit"},
+                    "usl": {"type": "number", "description": "Upper specification limit"},
+                    "target": {
+                        "type": "number",
+                        "description": "Target value (optional, defaults to midpoint of LSL/USL)",
+                    },
+                },
+                "description": "Specification limits for capability analysis",
+                "anyOf": [
+                    {"required": ["lsl", "usl"]},
+                    {"required": ["lsl"]},
+                    {"required": ["usl"]},
+                ],
+            },
+            "distribution": {
+                "type": "string",
+                "enum": ["normal", "lognormal", "exponential", "weibull"],
+                "description": "Distribution type for probability plot analysis",
+                "default": "normal",
+            },
+            "include_visualization": INCLUDE_VISUALIZATION_PROPERTY,
+            "confidence_level": {
+                "type": "number",
+                "minimum": 0.8,
+                "maximum": 0.99,
+                "description": "Confidence level for statistical tests",
+                "default": 0.95,
+            },
+        },
+        "anyOf": [{"required": ["data"]}, {"required": ["data_b64"]}],
+    }
+
     def __init__(self):
         """Initialize the Process Analysis tool."""
         super().__init__(
@@ -39,54 +102,7 @@ class ProcessAnalysisTool(SimplifiedMCPTool):
 
     def get_input_schema(self) -> dict[str, Any]:
         """Return the JSON schema for tool inputs."""
-        return {
-            "type": "object",
-            "properties": {
-                "data": {
-                    "type": "array",
-                    "items": {"type": "number"},
-                    "description": "Array of measurement values for comprehensive process analysis",
-                    "minItems": 10,
-                    "maxItems": 10000,
-                },
-                "title": {
-                    "type": "string",
-                    "description": "Optional title for the analysis",
-                    "default": "Process Analysis",
-                },
-                "specification_limits": {
-                    "type": "object",
-                    "properties": {
-                        "lsl": {"type": "number", "description": "Lower specification limit"},
-                        "usl": {"type": "number", "description": "Upper specification limit"},
-                        "target": {
-                            "type": "number",
-                            "description": "Target value (optional, defaults to midpoint of LSL/USL)",
-                        },
-                    },
-                    "description": "Specification limits for capability analysis",
-                    "anyOf": [
-                        {"required": ["lsl", "usl"]},
-                        {"required": ["lsl"]},
-                        {"required": ["usl"]},
-                    ],
-                },
-                "distribution": {
-                    "type": "string",
-                    "enum": ["normal", "lognormal", "exponential", "weibull"],
-                    "description": "Distribution type for probability plot analysis",
-                    "default": "normal",
-                },
-                "confidence_level": {
-                    "type": "number",
-                    "minimum": 0.8,
-                    "maximum": 0.99,
-                    "description": "Confidence level for statistical tests",
-                    "default": 0.95,
-                },
-            },
-            "required": ["data"],
-        }
+        return self._INPUT_SCHEMA
 
     def analyze(self, arguments: dict[str, Any]) -> dict[str, Any]:
         """Perform comprehensive process analysis.
@@ -97,22 +113,32 @@ class ProcessAnalysisTool(SimplifiedMCPTool):
         Returns:
             Combined analysis results from all three methods
         """
+        import numpy as np
+
+        from ..core.calculations import (
+            calculate_i_chart,
+            calculate_moments,
+            calculate_probability_plot,
+            calculate_process_capability,
+        )
+
         # Extract validated data
-        values = np.array(arguments["data"])
+        values = np.ascontiguousarray(arguments["data"], dtype=np.float64)
         title = arguments.get("title", "Process Analysis")
         spec_limits = arguments.get("specification_limits", {})
         distribution = arguments.get("distribution", "normal")
         confidence_level = arguments.get("confidence_level", 0.95)
 
         # Initialize results structure
+        moments = calculate_moments(values)
         results = {
             "process_summary": {
-                "sample_size": len(values),
+                "sample_size": moments["sample_size"],
                 "measurement_range": {
-                    "minimum": float(np.min(values)),
-                    "maximum": float(np.max(values)),
-                    "mean": float(np.mean(values)),
-                    "std_dev": float(np.std(values, ddof=1)),
+                    "minimum": moments["minimum"],
+                    "maximum": moments["maximum"],
+                    "mean": moments["mean"],
+                    "std_dev": moments["std_dev"],
                 },
             }
         }
@@ -144,6 +170,7 @@ class ProcessAnalysisTool(SimplifiedMCPTool):
                     spec_limits.get("lsl"),
                     spec_limits.get("usl"),
                     spec_limits.get("target"),
+                    moments=moments,
                 )
                 results["capability_analysis"] = {
                     "type": "capability",
@@ -201,6 +228,22 @@ class ProcessAnalysisTool(SimplifiedMCPTool):
 
         return results
 
+    @staticmethod
+    def classify_capability(cpk: float) -> str:
+        """Classify process capability from Cpk.
+
+        Args:
+            cpk: Process capability index
+
+        Returns:
+            One of "capable", "marginal" or "not_capable"
+        """
+        if cpk >= CPK_CAPABLE:
+            return "capable"
+        elif cpk >= CPK_MARGINAL:
+            return "marginal"
+        return "not_capable"
+
     def create_comprehensive_interpretation(self, results: dict[str, Any]) -> str:
         """Create comprehensive interpretation combining all analyses.
 
@@ -239,18 +282,8 @@ class ProcessAnalysisTool(SimplifiedMCPTool):
         if "capability_indices" in capability:
             indices = capability["capability_indices"]
             cpk = indices.get("cpk", 0)
-            if cpk >= 1.33:
-                interpretations.append(
-                    f"Process is capable (Cpk = {cpk:.3f}) and meets specification requirements."
-                )
-            elif cpk >= 1.0:
-                interpretations.append(
-                    f"Process has marginal capability (Cpk = {cpk:.3f}) and may need improvement."
-                )
-            else:
-                interpretations.append(
-                    f"Process is not capable (Cpk = {cpk:.3f}) and requires significant improvement."
-                )
+            template = CAPABILITY_MESSAGES[self.classify_capability(cpk)]
+            interpretations.append(template.format(cpk=cpk))
         elif "note" in capability:
             interpretations.append(
                 "Capability analysis requires specification limits for assessment."
@@ -304,15 +337,13 @@ class ProcessAnalysisTool(SimplifiedMCPTool):
         capability = results.get("capability_analysis", {})
         if "capability_indices" in capability:
             cpk = capability["capability_indices"].get("cpk", 0)
-            if cpk >= 1.33:
-                assessment["capability_status"] = "capable"
-            elif cpk >= 1.0:
-                assessment["capability_status"] = "marginal"
+            status = self.classify_capability(cpk)
+            assessment["capability_status"] = status
+            if status == "marginal":
                 assessment["recommendations"].append(
                     "Improve process capability through variation reduction"
                 )
-            else:
-                assessment["capability_status"] = "not_capable"
+            elif status == "not_capable":
                 assessment["recommendations"].append(
                     "Significant process improvement required to meet specifications"
                 )
@@ -4,13 +4,20 @@ This module provides a streamlined base class for MCP tools, removing the comple
 of multi-format visualization in favor of reliable single-format output.
 """
 
+import base64
+import binascii
 import logging
 from abc import abstractmethod
 from typing import Any
 
 from .base import BaseMCPTool
 
-# from ..browser.core_browser import generate_sample_data_browser
+# Shared schema property letting MCP clients skip chart rendering
+INCLUDE_VISUALIZATION_PROPERTY = {
+    "type": "boolean",
+    "default": True,
+    "description": "Generate the HTML visualization (set false for statistics only)",
+}
 
 
 class SimplifiedMCPTool(BaseMCPTool):
@@ -32,7 +39,7 @@ class SimplifiedMCPTool(BaseMCPTool):
         self.description = description
         self.logger = logging.getLogger(self.__class__.__name__)
 
-    def execute(self, arguments: dict[str, Any]) -> dict[str, Any]:
+    def execute(self, arguments: dict[str, Any], *, trusted: bool = False) -> dict[str, Any]:
         """Execute analysis and return simple statistical results.
 
         This method handles validation, analysis execution, and returns
@@ -40,6 +47,8 @@ class SimplifiedMCPTool(BaseMCPTool):
 
         Args:
             arguments: Tool execution parameters
+            trusted: Skip argument validation for in-process callers whose
+                arguments were already validated upstream
 
         Returns:
             Dictionary containing statistical analysis results
@@ -48,7 +57,7 @@ class SimplifiedMCPTool(BaseMCPTool):
             self.logger.debug(f"Executing {self.name} with arguments: {arguments}")
 
             # Validate input arguments
-            validated_args = self.validate_arguments(arguments)
+            validated_args = arguments if trusted else self.validate_arguments(arguments)
 
             # Execute the statistical analysis
             analysis_result = self.analyze(validated_args)
@@ -98,6 +107,8 @@ class SimplifiedMCPTool(BaseMCPTool):
         Raises:
             ValueError: If arguments are invalid
         """
+        import numpy as np
+
         if not isinstance(arguments, dict):
             raise ValueError("Arguments must be a dictionary")
 
@@ -110,18 +121,60 @@ class SimplifiedMCPTool(BaseMCPTool):
             if not isinstance(data, list):
                 raise ValueError("Data must be a list")
 
-            # Convert to numeric and filter out invalid values
-            numeric_data = []
-            for item in data:
-                try:
-                    numeric_data.append(float(item))
-                except (ValueError, TypeError):
-                    continue
-
-            if not numeric_data:
+            # Fast path: a flat list of numbers converts in one vectorised step;
+            # ragged or mixed lists fall back to the per-item loop
+            try:
+                array = np.asarray(data)
+            except (ValueError, TypeError):
+                array = None
+            if (
+                array is not None
+                and array.ndim == 1
+                and array.size > 0
+                and array.dtype.kind in "biuf"
+            ):
+                validated["data"] = array.astype(np.float64)
+            else:
+                # Convert to numeric and filter out invalid values
+                numeric_data = []
+                for item in data:
+                    try:
+                        numeric_data.append(float(item))
+                    except (ValueError, TypeError):
+                        continue
+
+                if not numeric_data:
+                    raise ValueError("No valid numeric data found")
+
+                validated["data"] = np.array(numeric_data)
+
+        # Binary-encoded data: base64 of little-endian float64 values
+        if "data_b64" in arguments and "data" not in validated:
+            try:
+                raw = base64.b64decode(arguments["data_b64"], validate=True)
+            except (binascii.Error, TypeError, ValueError):
+                raise ValueError("data_b64 must be base64-encoded little-endian float64 values")
+            if len(raw) % 8:
+                raise ValueError(
+                    f"data_b64 decodes to {len(raw)} bytes, which is not a whole number "
+                    "of 8-byte float64 values"
+                )
+            array = np.frombuffer(raw, dtype="<f8")
+
+            if array.size == 0:
                 raise ValueError("No valid numeric data found")
 
-            validated["data"] = numeric_data
+            # Same length limits the schema puts on the JSON data list
+            data_schema = self.get_input_schema().get("properties", {}).get("data", {})
+            min_items = data_schema.get("minItems", 1)
+            max_items = data_schema.get("maxItems")
+            if array.size < min_items or (max_items is not None and array.size > max_items):
+                raise ValueError(
+                    f"data_b64 must contain between {min_items} and {max_items} values, "
+                    f"got {array.size}"
+                )
+
+            validated["data"] = array.astype(np.float64, copy=False)
 
         # Validate title
         if "title" in arguments:
@@ -144,7 +197,7 @@ class SimplifiedMCPTool(BaseMCPTool):
 
         # Copy any remaining parameters
         for key, value in arguments.items():
-            if key not in validated:
+            if key not in validated and key != "data_b64":
                 validated[key] = value
 
         return validated
@@ -158,6 +211,8 @@ class SimplifiedMCPTool(BaseMCPTool):
         Returns:
             Formatted statistics with consistent precision
         """
+        import numpy as np
+
         formatted = {}
 
         for key, value in stats.items():
@@ -169,13 +224,23 @@ class SimplifiedMCPTool(BaseMCPTool):
             elif isinstance(value, bool):
                 # Convert booleans to strings for JSON compatibility
                 formatted[key] = value
-            elif isinstance(value, list):
-                # Format lists of numbers
+            elif isinstance(value, list | np.ndarray):
+                # Purely numeric series are rounded in one vectorised call
                 try:
-                    formatted[key] = [
-                        round(float(x), 4) if isinstance(x, int | float) else x for x in value
-                    ]
-                except (ValueError, TypeError):
+                    series = np.asarray(value)
+                except ValueError:
+                    series = None
+                if series is not None and series.ndim == 1 and series.dtype.kind in "iuf":
+                    formatted[key] = np.round(series.astype(np.float64), 4).tolist()
+                elif isinstance(value, list):
+                    # Mixed lists keep non-numeric entries as they are
+                    try:
+                        formatted[key] = [
+                            round(float(x), 4) if isinstance(x, int | float) else x for x in value
+                        ]
+                    except (ValueError, TypeError):
+                        formatted[key] = value
+                else:
                     formatted[key] = value
             elif isinstance(value, dict):
                 # Recursively format nested dictionaries
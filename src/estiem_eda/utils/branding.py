@@ -107,20 +107,45 @@ def add_estiem_footer(
     return fig
 
 
+# ESTIEM brand colors
+ESTIEM_COLORS = {
+    "primary_green": "#2E8B57",  # ESTIEM main green
+    "secondary_green": "#228B22",  # Darker green
+    "light_green": "#90EE90",  # Light green for fills
+    "text_gray": "#333333",  # Professional text
+    "light_gray": "#666666",  # Secondary text
+    "background": "#FFFFFF",  # Clean background
+}
+
+# Theme patches applied by apply_estiem_theme; plotly copies them into the figure
+_THEME_LAYOUT = {
+    "plot_bgcolor": ESTIEM_COLORS["background"],
+    "paper_bgcolor": ESTIEM_COLORS["background"],
+    "font": {"family": "Arial, sans-serif", "size": 12, "color": ESTIEM_COLORS["text_gray"]},
+    "title_font": {
+        "family": "Arial, sans-serif",
+        "size": 16,
+        "color": ESTIEM_COLORS["text_gray"],
+        "weight": "bold",
+    },
+}
+_THEME_AXES = {
+    "showgrid": True,
+    "gridwidth": 1,
+    "gridcolor": "lightgray",
+    "showline": True,
+    "linewidth": 2,
+    "linecolor": ESTIEM_COLORS["primary_green"],
+}
+
+
 def get_estiem_color_scheme() -> dict:
     """Get ESTIEM brand colors for consistent styling.
 
     Returns:
         Dictionary of ESTIEM brand colors
     """
-    return {
-        "primary_green": "#2E8B57",  # ESTIEM main green
-        "secondary_green": "#228B22",  # Darker green
-        "light_green": "#90EE90",  # Light green for fills
-        "text_gray": "#333333",  # Professional text
-        "light_gray": "#666666",  # Secondary text
-        "background": "#FFFFFF",  # Clean background
-    }
+    return dict(ESTIEM_COLORS)
 
 
 def apply_estiem_theme(fig: go.Figure) -> go.Figure:
@@ -132,37 +157,8 @@ def apply_estiem_theme(fig: go.Figure) -> go.Figure:
     Returns:
         Figure with ESTIEM theme applied
     """
-    colors = get_estiem_color_scheme()
-
-    fig.update_layout(
-        plot_bgcolor=colors["background"],
-        paper_bgcolor=colors["background"],
-        font={"family": "Arial, sans-serif", "size": 12, "color": colors["text_gray"]},
-        title_font={
-            "family": "Arial, sans-serif",
-            "size": 16,
-            "color": colors["text_gray"],
-            "weight": "bold",
-        },
-    )
-
-    # Update axes styling
-    fig.update_xaxes(
-        showgrid=True,
-        gridwidth=1,
-        gridcolor="lightgray",
-        showline=True,
-        linewidth=2,
-        linecolor=colors["primary_green"],
-    )
-
-    fig.update_yaxes(
-        showgrid=True,
-        gridwidth=1,
-        gridcolor="lightgray",
-        showline=True,
-        linewidth=2,
-        linecolor=colors["primary_green"],
-    )
+    fig.update_layout(_THEME_LAYOUT)
+    fig.update_xaxes(_THEME_AXES)
+    fig.update_yaxes(_THEME_AXES)
 
     return fig
@@ -11,6 +11,13 @@ from abc import ABC, abstractmethod
 from .visualization_response import ArtifactData, ChartData, FormatContent, VisualizationFormat
 
 
+def _json_default(obj):
+    """Serialize NumPy arrays and scalars so chart data need not be converted upfront."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class BaseFormatGenerator(ABC):
     """Abstract base class for format generators."""
 
@@ -42,7 +49,7 @@ class BaseFormatGenerator(ABC):
         if isinstance(content, str):
             return len(content.encode("utf-8")) / 1024
         elif isinstance(content, dict):
-            return len(json.dumps(content).encode("utf-8")) / 1024
+            return len(json.dumps(content, default=_json_default).encode("utf-8")) / 1024
         else:
             return len(str(content).encode("utf-8")) / 1024
 
@@ -142,8 +149,8 @@ class PlotlyHTMLGenerator(BaseFormatGenerator):
 
     <script>
         // Chart data and configuration
-        const data = {json.dumps(chart_data.data_series, indent=2)};
-        const layout = {json.dumps(chart_data.layout_config, indent=2)};
+        const data = {json.dumps(chart_data.data_series, indent=2, default=_json_default)};
+        const layout = {json.dumps(chart_data.layout_config, indent=2, default=_json_default)};
 
         // Enhanced layout with ESTIEM styling
         layout.font = layout.font || {{}};
@@ -214,11 +221,11 @@ import Plot from 'react-plotly.js';
 
 const {component_name} = ({{ data, layout, config, title }}) => {{
   // Default data from analysis
-  const defaultData = {json.dumps(chart_data.data_series, indent=2)};
+  const defaultData = {json.dumps(chart_data.data_series, indent=2, default=_json_default)};
 
   // Default layout with ESTIEM styling
   const defaultLayout = {{
-    ...{json.dumps(chart_data.layout_config, indent=2)},
+    ...{json.dumps(chart_data.layout_config, indent=2, default=_json_default)},
     font: {{
       family: '{chart_data.styling_info.get("font_family", "Open Sans, sans-serif")}',
       color: '#333'
@@ -416,6 +423,16 @@ class ConfigGenerator(BaseFormatGenerator):
 class TextFallbackGenerator(BaseFormatGenerator):
     """Generator for text-based fallback visualizations."""
 
+    # Text builder method for each chart type; others use the generic builder
+    _TEXT_BUILDERS = {
+        "control_chart": "_generate_control_chart_text",
+        "i_chart": "_generate_control_chart_text",
+        "histogram": "_generate_histogram_text",
+        "boxplot": "_generate_boxplot_text",
+        "pareto": "_generate_pareto_text",
+        "probability_plot": "_generate_probability_plot_text",
+    }
+
     def generate(
         self, chart_data: ChartData, analysis_results: dict | None = None, **kwargs
     ) -> FormatContent:
@@ -429,21 +446,9 @@ class TextFallbackGenerator(BaseFormatGenerator):
         Returns:
             Text fallback format content
         """
-        chart_data.chart_type.replace("_", " ").title()
-
         # Create text representation based on chart type
-        if chart_data.chart_type == "control_chart" or chart_data.chart_type == "i_chart":
-            text_content = self._generate_control_chart_text(chart_data, analysis_results or {})
-        elif chart_data.chart_type == "histogram":
-            text_content = self._generate_histogram_text(chart_data, analysis_results or {})
-        elif chart_data.chart_type == "boxplot":
-            text_content = self._generate_boxplot_text(chart_data, analysis_results or {})
-        elif chart_data.chart_type == "pareto":
-            text_content = self._generate_pareto_text(chart_data, analysis_results or {})
-        elif chart_data.chart_type == "probability_plot":
-            text_content = self._generate_probability_plot_text(chart_data, analysis_results or {})
-        else:
-            text_content = self._generate_generic_text(chart_data, analysis_results or {})
+        builder = self._TEXT_BUILDERS.get(chart_data.chart_type, "_generate_generic_text")
+        text_content = getattr(self, builder)(chart_data, analysis_results or {})
 
         size_kb = self.calculate_size_kb(text_content)
 
@@ -513,13 +518,10 @@ Generated by ESTIEM EDA Toolkit - Process Capability Analysis"""
 ====================
 
 ANOVA Results:
-• F-statistic: {anova.get("f_statistic", "N/A"):.3f}
-• p-value: {anova.get("p_value", "N/A"):.4f}
-• Degrees of Freedom: {anova.get("degrees_freedom", [])}
-
-Effect Size:
-• Eta Squared (η²): {anova.get("effect_size", {}).get("eta_squared", "N/A"):.3f}
-• Omega Squared (ω²): {anova.get("effect_size", {}).get("omega_squared", "N/A"):.3f}
+• F-statistic: {anova.get("f_statistic", float("nan")):.3f}
+• p-value: {anova.get("p_value", float("nan")):.4f}
+• Degrees of Freedom: {anova.get("df_between", "N/A")} between, {anova.get("df_within", "N/A")} within
+• Significant at α = {anova.get("alpha", "N/A")}: {"Yes" if anova.get("significant") else "No"}
 
 Group Statistics:
 {self._format_group_stats(results.get("group_statistics", {}))}
@@ -531,12 +533,14 @@ Generated by ESTIEM EDA Toolkit - ANOVA Analysis"""
     def _generate_pareto_text(self, chart_data: ChartData, results: dict) -> str:
         """Generate text representation of Pareto analysis."""
         vital_few = results.get("vital_few", {})
+        stats = results.get("statistics", {})
         categories = results.get("categories", [])
         percentages = results.get("percentages", [])
 
-        pareto_table = []
-        for i, (cat, pct) in enumerate(zip(categories, percentages, strict=False)):
-            pareto_table.append(f"  {i + 1:2d}. {cat:<20} {pct:6.1f}%")
+        pareto_table = "\n".join(
+            f"  {i:2d}. {cat:<20} {pct:6.1f}%"
+            for i, (cat, pct) in enumerate(zip(categories, percentages, strict=False), start=1)
+        )
 
         return f"""Pareto Analysis Results
 ======================
@@ -546,11 +550,11 @@ Vital Few Identification:
 • Total contribution: {vital_few.get("contribution_percent", "N/A"):.1f}%
 
 Category Ranking:
-{chr(10).join(pareto_table)}
+{pareto_table}
 
 Statistics:
-• Total Count: {results.get("statistics", {}).get("total_count", "N/A")}
-• Concentration Ratio: {results.get("statistics", {}).get("concentration_ratio", "N/A"):.3f}
+• Total Count: {stats.get("total_count", "N/A")}
+• Concentration Ratio: {stats.get("concentration_ratio", "N/A"):.3f}
 
 Interpretation: {results.get("interpretation", "No interpretation available")}
 
@@ -599,14 +603,11 @@ Generated by ESTIEM EDA Toolkit - Statistical Process Control"""
         if not group_stats:
             return "  No group statistics available"
 
-        lines = []
-        for group_name, stats in group_stats.items():
-            mean = stats.get("mean", "N/A")
-            std = stats.get("std", "N/A")
-            n = stats.get("n", "N/A")
-            lines.append(f"  {group_name}: Mean={mean:.3f}, SD={std:.3f}, n={n}")
-
-        return "\n".join(lines)
+        return "\n".join(
+            f"  {group_name}: Mean={stats.get('mean', 'N/A'):.3f}, "
+            f"SD={stats.get('std', 'N/A'):.3f}, n={stats.get('size', 'N/A')}"
+            for group_name, stats in group_stats.items()
+        )
 
     def _format_dict_as_text(self, data: dict, indent: int = 0) -> str:
         """Recursively format dictionary as readable text."""
@@ -635,6 +636,39 @@ class MultiFormatGenerator:
         self.text_generator = TextFallbackGenerator()
         self.logger = logging.getLogger(__name__)
 
+    def generate_format(
+        self,
+        format_type: VisualizationFormat,
+        chart_data: ChartData,
+        analysis_results: dict | None = None,
+    ) -> FormatContent:
+        """Generate a single visualization format.
+
+        Use this when the client consumes one format, so the others are never built.
+
+        Args:
+            format_type: Format to generate
+            chart_data: Structured chart information
+            analysis_results: Statistical analysis results (used by the text fallback)
+
+        Returns:
+            Format content for the requested type
+
+        Raises:
+            ValueError: If the format type is not supported
+        """
+        if format_type == VisualizationFormat.HTML_PLOTLY:
+            return self.html_generator.generate(chart_data)
+        elif format_type == VisualizationFormat.ARTIFACT_REACT:
+            return self.artifact_generator.generate(chart_data, artifact_type="react")
+        elif format_type == VisualizationFormat.ARTIFACT_HTML:
+            return self.artifact_generator.generate(chart_data, artifact_type="html")
+        elif format_type == VisualizationFormat.CHART_CONFIG:
+            return self.config_generator.generate(chart_data)
+        elif format_type == VisualizationFormat.TEXT_FALLBACK:
+            return self.text_generator.generate(chart_data, analysis_results)
+        raise ValueError(f"Unsupported visualization format: {format_type}")
+
     def generate_all_formats(
         self,
         chart_data: ChartData,
@@ -658,26 +692,9 @@ class MultiFormatGenerator:
 
         for format_type in formats:
             try:
-                if format_type == VisualizationFormat.HTML_PLOTLY:
-                    content = self.html_generator.generate(chart_data)
-                    generated_formats[format_type] = content
-
-                elif format_type == VisualizationFormat.ARTIFACT_REACT:
-                    content = self.artifact_generator.generate(chart_data, artifact_type="react")
-                    generated_formats[format_type] = content
-
-                elif format_type == VisualizationFormat.ARTIFACT_HTML:
-                    content = self.artifact_generator.generate(chart_data, artifact_type="html")
-                    generated_formats[format_type] = content
-
-                elif format_type == VisualizationFormat.CHART_CONFIG:
-                    content = self.config_generator.generate(chart_data)
-                    generated_formats[format_type] = content
-
-                elif format_type == VisualizationFormat.TEXT_FALLBACK:
-                    content = self.text_generator.generate(chart_data, analysis_results)
-                    generated_formats[format_type] = content
-
+                generated_formats[format_type] = self.generate_format(
+                    format_type, chart_data, analysis_results
+                )
                 self.logger.debug(f"Generated {format_type.value} format successfully")
 
             except Exception as e:
@@ -5,13 +5,111 @@ on HTML-first delivery with text fallbacks for maximum reliability.
 """
 
 import logging
+import math
 import time
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
 from .format_generators import PlotlyHTMLGenerator, TextFallbackGenerator
 from .visualization_response import ChartData, create_chart_data
 
+# Significant digits kept in plotted series, relative to the largest value in
+# the series; charts do not need full float precision
+DISPLAY_SIGNIFICANT_DIGITS = 6
+
+
+def _display_series(values) -> np.ndarray:
+    """Round a numeric series for plotting, which also keeps the embedded JSON short.
+
+    The number of decimals follows the magnitude of the series, so small-scale
+    data keeps its resolution.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    finite = np.abs(values[np.isfinite(values)])
+    largest = finite.max() if finite.size else 0.0
+    if largest == 0:
+        return values
+    decimals = DISPLAY_SIGNIFICANT_DIGITS - 1 - math.floor(math.log10(largest))
+    # Rounding scales by 10**decimals, which overflows for subnormal-scale data
+    if decimals > 300:
+        return values
+    return np.round(values, decimals)
+
+
+# Keys shared by every straight-line trace (control limits, fit lines)
+_LINE_TRACE = {"type": "scatter", "mode": "lines", "showlegend": True}
+
+
+def _line_trace(x: list, y: list, name: str, line: dict[str, Any]) -> dict[str, Any]:
+    """Build a straight-line Plotly trace from the shared line trace keys."""
+    return {**_LINE_TRACE, "x": x, "y": y, "name": name, "line": line}
+
+
+# Chart layouts that do not depend on the analysis results, built once and
+# treated as read-only by the format generators
+_TITLE_STYLE = {"font": {"size": 16, "color": "#1f4e79"}, "x": 0.5, "xanchor": "center"}
+
+_CONTROL_CHART_LAYOUT = {
+    "title": {
+        "text": "Individual Control Chart Analysis",
+        **_TITLE_STYLE,
+    },
+    "xaxis": {"title": "Sample Number", "showgrid": True},
+    "yaxis": {"title": "Measurement Value", "showgrid": True},
+    "hovermode": "x unified",
+    "legend": {"orientation": "h", "y": -0.3, "x": 0.5, "xanchor": "center"},
+}
+
+_CAPABILITY_LAYOUT = {
+    "title": {
+        "text": "Process Capability Analysis",
+        **_TITLE_STYLE,
+    },
+    "xaxis": {"title": "Capability Index"},
+    "yaxis": {"title": "Value"},
+    "showlegend": False,
+}
+
+_ANOVA_LAYOUT = {
+    "title": {
+        "text": "ANOVA Group Comparison",
+        **_TITLE_STYLE,
+    },
+    "xaxis": {"title": "Groups"},
+    "yaxis": {"title": "Values"},
+}
+
+_PARETO_LAYOUT = {
+    "title": {
+        "text": "Pareto Analysis",
+        **_TITLE_STYLE,
+    },
+    "xaxis": {"title": "Categories"},
+    "yaxis": {"title": "Count", "side": "left"},
+    "yaxis2": {"title": "Cumulative %", "side": "right", "overlaying": "y"},
+}
+
+_EMPTY_PARETO_LAYOUT = {"title": {"text": "Pareto Analysis (no data)", **_TITLE_STYLE}}
+
+# Static keys of the Pareto traces; only the plotted series change per chart
+_PARETO_BAR_TRACE = {"type": "bar", "name": "Count", "marker": {"color": "#1f4e79"}, "yaxis": "y"}
+_PARETO_CUMULATIVE_TRACE = {
+    "type": "scatter",
+    "mode": "lines+markers",
+    "name": "Cumulative %",
+    "line": {"color": "red", "width": 3},
+    "yaxis": "y2",
+}
+
+# Only the title of the probability plot depends on the fit, so it is merged in
+_PROBABILITY_LAYOUT = {
+    "xaxis": {"title": "Standard Normal Quantiles", "showgrid": True},
+    "yaxis": {"title": "Observed Values", "showgrid": True},
+    "hovermode": "closest",
+}
+
 
 @dataclass
 class SimpleVisualizationResult:
@@ -88,7 +186,7 @@ class SimplifiedVisualizationResponse:
             return self._create_control_chart_data()
         elif self.analysis_type == "process_capability":
             return self._create_capability_chart_data()
-        elif self.analysis_type == "anova":
+        elif self.analysis_type in ("anova", "anova_boxplot"):
             return self._create_anova_chart_data()
         elif self.analysis_type == "pareto_analysis":
             return self._create_pareto_chart_data()
@@ -109,64 +207,41 @@ class SimplifiedVisualizationResponse:
         ooc_indices = self.analysis_data.get("out_of_control_indices", [])
 
         # Create data series
-        x_values = list(range(1, len(data_points) + 1))
+        x_values = np.arange(1, len(data_points) + 1, dtype=np.int32)
+
+        # Out-of-control points are highlighted by scattering one color over the rest
+        marker_colors = np.full(len(data_points), "#1f4e79", dtype=object)
+        marker_colors[np.asarray(ooc_indices, dtype=np.intp)] = "red"
 
         plotly_data = [
             {
                 "x": x_values,
-                "y": data_points,
+                "y": _display_series(data_points),
                 "type": "scatter",
                 "mode": "lines+markers",
                 "name": "Process Data",
                 "line": {"color": "#1f4e79", "width": 2},
-                "marker": {
-                    "size": 8,
-                    "color": [
-                        "red" if i in ooc_indices else "#1f4e79" for i in range(len(data_points))
-                    ],
-                },
-            },
-            {
-                "x": [1, len(data_points)],
-                "y": [stats.get("mean", 0), stats.get("mean", 0)],
-                "type": "scatter",
-                "mode": "lines",
-                "name": f"Mean ({stats.get('mean', 0):.3f})",
-                "line": {"color": "green", "width": 2, "dash": "solid"},
-                "showlegend": True,
-            },
-            {
-                "x": [1, len(data_points)],
-                "y": [stats.get("ucl", 0), stats.get("ucl", 0)],
-                "type": "scatter",
-                "mode": "lines",
-                "name": f"UCL ({stats.get('ucl', 0):.3f})",
-                "line": {"color": "red", "width": 2, "dash": "dash"},
-                "showlegend": True,
-            },
-            {
-                "x": [1, len(data_points)],
-                "y": [stats.get("lcl", 0), stats.get("lcl", 0)],
-                "type": "scatter",
-                "mode": "lines",
-                "name": f"LCL ({stats.get('lcl', 0):.3f})",
-                "line": {"color": "red", "width": 2, "dash": "dash"},
-                "showlegend": True,
+                "marker": {"size": 8, "color": marker_colors},
             },
         ]
 
-        plotly_layout = {
-            "title": {
-                "text": "Individual Control Chart Analysis",
-                "font": {"size": 16, "color": "#1f4e79"},
-                "x": 0.5,
-                "xanchor": "center",
-            },
-            "xaxis": {"title": "Sample Number", "showgrid": True},
-            "yaxis": {"title": "Measurement Value", "showgrid": True},
-            "hovermode": "x unified",
-            "legend": {"orientation": "h", "y": -0.3, "x": 0.5, "xanchor": "center"},
-        }
+        # Center line and control limits share one horizontal-line trace shape
+        for key, label, color, dash in (
+            ("mean", "Mean", "green", "solid"),
+            ("ucl", "UCL", "red", "dash"),
+            ("lcl", "LCL", "red", "dash"),
+        ):
+            value = stats.get(key, 0)
+            plotly_data.append(
+                _line_trace(
+                    [1, len(data_points)],
+                    [value, value],
+                    f"{label} ({value:.3f})",
+                    {"color": color, "width": 2, "dash": dash},
+                )
+            )
+
+        plotly_layout = _CONTROL_CHART_LAYOUT
 
         return create_chart_data("control_chart", plotly_data, plotly_layout)
 
@@ -191,87 +266,65 @@ class SimplifiedVisualizationResponse:
             }
         ]
 
-        plotly_layout = {
-            "title": {
-                "text": "Process Capability Analysis",
-                "font": {"size": 16, "color": "#1f4e79"},
-                "x": 0.5,
-                "xanchor": "center",
-            },
-            "xaxis": {"title": "Capability Index"},
-            "yaxis": {"title": "Value"},
-            "showlegend": False,
-        }
+        plotly_layout = _CAPABILITY_LAYOUT
 
         return create_chart_data("capability_histogram", plotly_data, plotly_layout)
 
     def _create_anova_chart_data(self) -> ChartData:
         """Create chart data for ANOVA analysis."""
         group_stats = self.analysis_data.get("group_statistics", {})
+        boxplot_data = self.analysis_data.get("boxplot_data", {})
 
-        # Create box plot data
+        # Box plots are drawn from precomputed quartiles so raw data is not needed
         plotly_data = []
         for group_name, stats in group_stats.items():
-            # Simple representation - in real implementation would need actual data
-            plotly_data.append(
-                {
-                    "y": [stats.get("mean", 0)],  # Simplified - would need full data
-                    "type": "box",
-                    "name": str(group_name),
-                    "boxmean": True,
-                }
-            )
+            summary = boxplot_data.get(group_name)
+            if summary:
+                plotly_data.append(
+                    {
+                        "type": "box",
+                        "name": str(group_name),
+                        "x": [str(group_name)],
+                        "q1": [summary["q1"]],
+                        "median": [summary["median"]],
+                        "q3": [summary["q3"]],
+                        "lowerfence": [summary["lower_whisker"]],
+                        "upperfence": [summary["upper_whisker"]],
+                        "mean": [summary["mean"]],
+                        "boxmean": True,
+                    }
+                )
+            else:
+                plotly_data.append(
+                    {
+                        "y": [stats.get("mean", 0)],
+                        "type": "box",
+                        "name": str(group_name),
+                        "boxmean": True,
+                    }
+                )
 
-        plotly_layout = {
-            "title": {
-                "text": "ANOVA Group Comparison",
-                "font": {"size": 16, "color": "#1f4e79"},
-                "x": 0.5,
-                "xanchor": "center",
-            },
-            "xaxis": {"title": "Groups"},
-            "yaxis": {"title": "Values"},
-        }
+        plotly_layout = _ANOVA_LAYOUT
 
         return create_chart_data("boxplot", plotly_data, plotly_layout)
 
     def _create_pareto_chart_data(self) -> ChartData:
         """Create chart data for Pareto analysis."""
         categories = self.analysis_data.get("categories", [])
+        # The Pareto schema requires at least two categories, so anything less
+        # gets an empty chart instead of bar and cumulative traces
+        if len(categories) < 2:
+            return create_chart_data("pareto", [], _EMPTY_PARETO_LAYOUT)
+
         values = self.analysis_data.get("values", [])
         cumulative_percentages = self.analysis_data.get("cumulative_percentages", [])
 
         plotly_data = [
-            {
-                "x": categories,
-                "y": values,
-                "type": "bar",
-                "name": "Count",
-                "marker": {"color": "#1f4e79"},
-                "yaxis": "y",
-            },
-            {
-                "x": categories,
-                "y": cumulative_percentages,
-                "type": "scatter",
-                "mode": "lines+markers",
-                "name": "Cumulative %",
-                "line": {"color": "red", "width": 3},
-                "yaxis": "y2",
-            },
+            {"x": categories, "y": values, **_PARETO_BAR_TRACE},
+            {"x": categories, "y": cumulative_percentages, **_PARETO_CUMULATIVE_TRACE},
         ]
 
-        plotly_layout = {
-            "title": {
-                "text": "Pareto Analysis",
-                "font": {"size": 16, "color": "#1f4e79"},
-                "x": 0.5,
-                "xanchor": "center",
-            },
-            "xaxis": {"title": "Categories"},
-            "yaxis": {"title": "Count", "side": "left"},
-            "yaxis2": {"title": "Cumulative %", "side": "right", "overlaying": "y"},
-        }
+        plotly_layout = _PARETO_LAYOUT
 
         return create_chart_data("pareto", plotly_data, plotly_layout)
 
@@ -283,8 +336,8 @@ class SimplifiedVisualizationResponse:
 
         plotly_data = [
             {
-                "x": theoretical_quantiles,
-                "y": sorted_values,
+                "x": _display_series(theoretical_quantiles),
+                "y": _display_series(sorted_values),
                 "type": "scatter",
                 "mode": "markers",
                 "name": "Data Points",
@@ -298,29 +351,26 @@ class SimplifiedVisualizationResponse:
             slope = goodness.get("slope", 1)
             intercept = goodness.get("intercept", 0)
 
-            if theoretical_quantiles:
-                fit_x = [min(theoretical_quantiles), max(theoretical_quantiles)]
+            if len(theoretical_quantiles) > 0:
+                # Quantiles are ascending, so the endpoints are the min and max
+                fit_x = [theoretical_quantiles[0], theoretical_quantiles[-1]]
                 fit_y = [intercept + slope * x for x in fit_x]
 
+                # Rounded like the markers so the line and points stay aligned
                 plotly_data.append(
-                    {
-                        "x": fit_x,
-                        "y": fit_y,
-                        "type": "scatter",
-                        "mode": "lines",
-                        "name": f"Best Fit Line (r={correlation:.3f})",
-                        "line": {"color": "#f8a978", "width": 3},
-                    }
+                    _line_trace(
+                        _display_series(fit_x),
+                        _display_series(fit_y),
+                        f"Best Fit Line (r={correlation:.3f})",
+                        {"color": "#f8a978", "width": 3},
+                    )
                 )
 
-        plotly_layout = {
+        plotly_layout = _PROBABILITY_LAYOUT | {
             "title": {
                 "text": f"Normal Probability Plot Analysis<br><sub>Goodness of Fit: r = {correlation:.4f}</sub>",
                 "font": {"size": 16, "color": "#1f4e79"},
             },
-            "xaxis": {"title": "Standard Normal Quantiles", "showgrid": True},
-            "yaxis": {"title": "Observed Values", "showgrid": True},
-            "hovermode": "closest",
         }
 
         return create_chart_data("probability_plot", plotly_data, plotly_layout)
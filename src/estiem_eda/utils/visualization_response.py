@@ -332,6 +332,22 @@ class EnhancedVisualizationResponse:
         return True
 
 
+# Chart defaults shared by every ChartData; treat as read-only
+DEFAULT_STYLING = {
+    "color_scheme": "ESTIEM",
+    "font_family": "Open Sans, sans-serif",
+    "brand_colors": {"primary": "#1f4e79", "secondary": "#7ba7d1", "accent": "#f8a978"},
+}
+
+DEFAULT_INTERACTIVITY = {
+    "responsive": True,
+    "displayModeBar": True,
+    "export_formats": ["png", "svg", "pdf"],
+    "zoom_enabled": True,
+    "pan_enabled": True,
+}
+
+
 def create_chart_data(
     chart_type: str,
     plotly_data: list[dict],
@@ -349,27 +365,14 @@ def create_chart_data(
     Returns:
         Structured ChartData object
     """
-    default_styling = {
-        "color_scheme": "ESTIEM",
-        "font_family": "Open Sans, sans-serif",
-        "brand_colors": {"primary": "#1f4e79", "secondary": "#7ba7d1", "accent": "#f8a978"},
-    }
-
-    styling = {**default_styling, **(estiem_styling or {})}
-
-    interactivity = {
-        "responsive": True,
-        "displayModeBar": True,
-        "export_formats": ["png", "svg", "pdf"],
-        "zoom_enabled": True,
-        "pan_enabled": True,
-    }
+    # Shared defaults are only copied when custom styling has to be merged in
+    styling = {**DEFAULT_STYLING, **estiem_styling} if estiem_styling else DEFAULT_STYLING
 
     return ChartData(
         chart_type=chart_type,
         data_series=plotly_data,
         layout_config=plotly_layout,
         styling_info=styling,
-        interactivity=interactivity,
+        interactivity=DEFAULT_INTERACTIVITY,
         metadata={"created_at": time.time(), "generator": "ESTIEM EDA Enhanced MCP Server"},
     )
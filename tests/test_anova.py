@@ -153,6 +153,52 @@ class TestANOVATool:
         assert "p_value" in anova_results
         assert "significant" in anova_results
 
+        # Per-group normality checks are opt-in
+        assert "assumptions" not in result
+        result = tool.execute({"groups": normal_groups, "include_assumptions": True})
+        normality = result["assumptions"]["normality"]
+        assert set(normality) == set(normal_groups)
+        for check in normality.values():
+            assert check["test_used"] == "Shapiro-Wilk"
+            assert 0 <= check["p_value"] <= 1
+
+    def test_large_group_normality_test_selection(self):
+        """Very large groups use D'Agostino's test instead of Shapiro-Wilk."""
+        from estiem_eda.core.calculations import check_group_normality
+
+        rng = np.random.default_rng(0)
+        assert check_group_normality(rng.normal(size=6000))["test_used"] == "D'Agostino K-squared"
+        assert check_group_normality(rng.normal(size=50))["test_used"] == "Shapiro-Wilk"
+        assert check_group_normality(np.array([1.0, 2.0]))["test_used"] is None
+
+    def test_interpretation_can_be_skipped(self, sample_anova_groups):
+        """Interpretation text is omitted when not requested."""
+        tool = ANOVATool()
+        result = tool.execute({"groups": sample_anova_groups, "include_interpretation": False})
+
+        assert result["success"]
+        assert "anova_results" in result
+        assert "interpretation" not in result
+
+    def test_boxplot_summaries_only_for_charts(self, sample_anova_groups):
+        """Boxplot summaries are skipped when no chart will be rendered."""
+        tool = ANOVATool()
+        result = tool.execute({"groups": sample_anova_groups, "include_visualization": False})
+
+        assert result["success"]
+        assert "boxplot_data" not in result
+
+    def test_trusted_execution_skips_argument_validation(self, sample_anova_groups):
+        """Pre-validated arguments give the same results when marked trusted."""
+        tool = ANOVATool()
+        arguments = tool.validate_arguments({"groups": sample_anova_groups})
+
+        trusted = tool.execute(arguments, trusted=True)
+        checked = tool.execute({"groups": sample_anova_groups})
+
+        assert trusted["success"]
+        assert trusted["anova_results"] == checked["anova_results"]
+
     def test_assumption_violations(self, test_data_generator):
         """Test ANOVA with different data patterns."""
         tool = ANOVATool()
@@ -248,17 +294,21 @@ class TestANOVATool:
             group_boxplot = boxplot_data[group_name]
 
             # Required boxplot statistics
-            required_stats = ["q1", "median", "q3", "iqr", "min", "max", "outliers", "mean", "data"]
+            required_stats = ["q1", "median", "q3", "iqr", "min", "max", "outliers", "mean"]
             for stat in required_stats:
                 assert stat in group_boxplot
 
-            # Data integrity checks
-            data = group_boxplot["data"]
-            assert len(data) == len(sample_anova_groups[group_name])
+            # Raw observations are summarised, not embedded
+            assert "data" not in group_boxplot
+            assert len(group_boxplot["outliers"]) <= len(sample_anova_groups[group_name])
 
             # Statistical relationships
             assert group_boxplot["q1"] <= group_boxplot["median"] <= group_boxplot["q3"]
-            assert group_boxplot["iqr"] == group_boxplot["q3"] - group_boxplot["q1"]
+            assert group_boxplot["iqr"] == pytest.approx(
+                group_boxplot["q3"] - group_boxplot["q1"], abs=1e-3
+            )
+            assert group_boxplot["min"] <= group_boxplot["lower_whisker"] <= group_boxplot["q1"]
+            assert group_boxplot["q3"] <= group_boxplot["upper_whisker"] <= group_boxplot["max"]
 
     def test_alpha_level_customization(self, sample_anova_groups):
         """Test custom alpha level functionality."""
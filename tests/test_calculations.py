@@ -0,0 +1,144 @@
+"""Unit tests for the shared core calculation engine."""
+
+import json
+
+import numpy as np
+
+from estiem_eda.core.calculations import (
+    calculate_moments,
+    calculate_pareto,
+    calculate_process_capability,
+    calculate_process_capability_batch,
+    calculate_process_capability_update,
+    check_western_electric_rules,
+    update_moments,
+)
+
+
+class TestMoments:
+    """Test the shared descriptive moments helper."""
+
+    def test_matches_numpy(self, sample_capability_data):
+        values = np.array(sample_capability_data)
+        moments = calculate_moments(values)
+
+        assert moments["sample_size"] == len(values)
+        assert np.isclose(moments["mean"], np.mean(values))
+        assert np.isclose(moments["std_dev"], np.std(values, ddof=1))
+        assert np.isclose(moments["population_std"], np.std(values))
+        assert moments["minimum"] == np.min(values)
+        assert moments["maximum"] == np.max(values)
+
+    def test_update_matches_full_recalculation(self, sample_capability_data):
+        """Streaming updates give the same moments as one pass over all data."""
+        values = np.array(sample_capability_data)
+
+        moments = calculate_moments(values[:40])
+        moments = update_moments(moments, values[40:75])
+        moments = update_moments(moments, values[75:])
+        full = calculate_moments(values)
+
+        for key in full:
+            assert np.isclose(moments[key], full[key])
+
+    def test_capability_update_matches_batch_result(self, sample_capability_data):
+        """Incremental capability equals capability of the combined data."""
+        values = np.array(sample_capability_data)
+
+        result, moments = calculate_process_capability_update(
+            calculate_moments(values[:60]), values[60:], 9.0, 11.0
+        )
+        expected = calculate_process_capability(values, 9.0, 11.0)
+
+        assert moments["sample_size"] == len(values)
+        for key, value in expected["capability_indices"].items():
+            assert np.isclose(result["capability_indices"][key], value)
+
+
+class TestProcessCapability:
+    """Test the single-stream capability calculation."""
+
+    def test_extreme_tail_defect_rate_gives_six_sigma(self):
+        """A defect rate that underflows to zero probability does not break the sigma level."""
+        values = np.random.default_rng(0).normal(size=100)
+        values = (values - values.mean()) / values.std(ddof=1)
+
+        result = calculate_process_capability(values, -1000.0, 38.5)
+
+        assert result["defect_analysis"]["ppm_total"] > 0
+        assert result["defect_analysis"]["sigma_level"] == 6.0
+
+
+class TestProcessCapabilityBatch:
+    """Test vectorised capability across several process streams."""
+
+    def test_rows_match_single_stream_results(self, sample_capability_data):
+        values = np.array(sample_capability_data)
+        data = np.stack([values, values * 1.1, values + 0.5])
+        usl = np.array([12.0, 13.0, 12.5])
+
+        batch = calculate_process_capability_batch(data, 8.0, usl)
+
+        for i, row in enumerate(data):
+            single = calculate_process_capability(row, 8.0, usl[i])
+            for key, value in single["capability_indices"].items():
+                assert np.isclose(batch["capability_indices"][key][i], value)
+
+    def test_constant_stream_has_infinite_indices(self):
+        data = np.array([[5.0] * 10, np.linspace(4, 6, 10)])
+
+        batch = calculate_process_capability_batch(data, 0.0, 10.0)
+
+        assert np.isinf(batch["capability_indices"]["cpk"][0])
+        assert np.isfinite(batch["capability_indices"]["cpk"][1])
+
+    def test_results_are_json_ready_per_stream_lists(self):
+        data = np.array([np.linspace(4, 6, 10), np.linspace(3, 7, 10)])
+
+        batch = calculate_process_capability_batch(data, 0.0, 10.0, target=[5.0, 4.0])
+        default = calculate_process_capability_batch(data, 0.0, 10.0)
+
+        json.dumps(batch)
+        assert all(isinstance(v, list) for v in batch["capability_indices"].values())
+        assert batch["statistics"]["lsl"] == [0.0, 0.0]
+        assert batch["statistics"]["target"] == [5.0, 4.0]
+        assert default["statistics"]["target"] == [5.0, 5.0]
+
+
+class TestPareto:
+    """Test the core Pareto calculation."""
+
+    def test_tied_categories_keep_input_order(self):
+        first = calculate_pareto({"a": 1.0, "b": 1.0})
+        second = calculate_pareto({"b": 1.0, "a": 1.0})
+
+        assert first["categories"] == ["a", "b"]
+        assert second["categories"] == ["b", "a"]
+
+
+class TestWesternElectricRules:
+    """Test control chart pattern rules."""
+
+    def test_rule4_flags_every_window_of_a_long_run(self):
+        """A run of 9 points above center gives two overlapping 8-point windows."""
+        values = np.array([0.0, -1.0] + [1.0] * 9 + [-1.0, 0.0])
+
+        violations = check_western_electric_rules(values, 0.0, 10.0, -10.0, 5.0)
+        rule4 = [v["points"] for v in violations if v["rule"] == 4]
+
+        assert rule4 == [list(range(2, 10)), list(range(3, 11))]
+
+    def test_points_on_center_line_break_runs(self):
+        values = np.array([1.0] * 4 + [0.0] + [1.0] * 4)
+
+        violations = check_western_electric_rules(values, 0.0, 10.0, -10.0, 5.0)
+
+        assert not [v for v in violations if v["rule"] == 4]
+
+    def test_rule2_flags_windows_with_two_points_beyond_two_sigma(self):
+        values = np.array([0.0, 2.5, 0.0, -2.5, 0.0, 0.0])
+
+        violations = check_western_electric_rules(values, 0.0, 10.0, -10.0, 1.0)
+        rule2 = [v["points"] for v in violations if v["rule"] == 2]
+
+        assert rule2 == [[1, 2, 3]]
@@ -0,0 +1,20 @@
+"""Unit tests for the chart format generators."""
+
+import numpy as np
+
+from estiem_eda.utils.format_generators import TextFallbackGenerator
+from estiem_eda.utils.visualization_response import create_chart_data
+
+
+class TestTextFallbackGenerator:
+    """Test text fallbacks for charts without a dedicated builder."""
+
+    def test_generic_text_for_unknown_chart_type(self):
+        chart_data = create_chart_data("scatter", [], {"title": "Scatter"})
+        results = {"statistics": {"mean": np.float64(1.5), "n": 3}, "points": np.arange(3)}
+
+        text = TextFallbackGenerator().generate(chart_data, results).content
+
+        assert "Chart Type: Scatter" in text
+        assert "mean: 1.5" in text
+        assert "points: " in text
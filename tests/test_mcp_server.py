@@ -277,6 +277,75 @@ class TestMCPServer:
             assert len(tool.description) > 10
             assert isinstance(tool.name, str)
 
+    def test_call_tool_without_visualization(self):
+        """Statistics-only responses skip HTML generation."""
+        server = ESTIEMMCPServer()
+
+        response = server.handle_call_tool(
+            {
+                "name": "pareto_analysis",
+                "arguments": {"data": {"A": 50, "B": 30, "C": 20}, "include_visualization": False},
+            }
+        )
+
+        payload = json.loads(response["content"][0]["text"])
+        assert payload["success"]
+        assert "html_visualization" not in payload
+        assert "visualization_metadata" not in payload
+
+        for tool in server.tools.values():
+            assert "include_visualization" in tool.get_input_schema()["properties"]
+
+    def test_process_analysis_accepts_base64_data(self):
+        """Binary float64 data is decoded into the same analysis as a JSON list."""
+        import base64
+
+        import numpy as np
+
+        server = ESTIEMMCPServer()
+        values = np.random.default_rng(7).normal(10.0, 1.0, 30)
+        encoded = base64.b64encode(values.astype("<f8").tobytes()).decode()
+
+        response = server.handle_call_tool(
+            {
+                "name": "process_analysis",
+                "arguments": {"data_b64": encoded, "include_visualization": False},
+            }
+        )
+
+        payload = json.loads(response["content"][0]["text"])
+        summary = payload["process_summary"]
+        assert summary["sample_size"] == 30
+        assert abs(summary["measurement_range"]["mean"] - values.mean()) < 1e-9
+
+    def test_base64_data_respects_schema_bounds(self):
+        """Decoded base64 data gets the same length checks as a JSON list."""
+        import base64
+
+        import numpy as np
+        import pytest
+
+        tool = ESTIEMMCPServer().tools["process_analysis"]
+
+        def encode(raw):
+            return {"data_b64": base64.b64encode(raw).decode()}
+
+        for size in (1, 10001):
+            with pytest.raises(ValueError, match="between 10 and 10000 values"):
+                tool.validate_arguments(encode(np.ones(size, dtype="<f8").tobytes()))
+
+        with pytest.raises(ValueError, match="not a whole number of 8-byte float64 values"):
+            tool.validate_arguments(encode(bytes(7)))
+
+    def test_ragged_data_drops_non_numeric_items(self):
+        """Nested or non-numeric items are skipped rather than failing validation."""
+        server = ESTIEMMCPServer()
+        tool = server.tools["process_analysis"]
+
+        validated = tool.validate_arguments({"data": [1, 2, [3, 4], 5, "x", 6]})
+
+        assert validated["data"].tolist() == [1.0, 2.0, 5.0, 6.0]
+
     def test_visualization_integration(self):
         """Test visualization data integration."""
         server = ESTIEMMCPServer()
@@ -0,0 +1,40 @@
+"""Unit tests for the simplified visualization response."""
+
+from estiem_eda.tools.anova import ANOVATool
+from estiem_eda.utils.simplified_visualization import (
+    SimplifiedVisualizationResponse,
+    _display_series,
+)
+
+
+class TestDisplaySeries:
+    """Test rounding of plotted series."""
+
+    def test_small_scale_values_keep_their_resolution(self):
+        values = [0.000123, 0.000131, 0.000118, 0.000127]
+
+        assert _display_series(values).tolist() == values
+
+    def test_rounds_to_significant_digits(self):
+        assert _display_series([10.123456789, 9.87654321]).tolist() == [10.1235, 9.8765]
+        assert _display_series([0.0, 0.0]).tolist() == [0.0, 0.0]
+
+
+class TestTextSummary:
+    """Test the text summaries returned alongside the HTML chart."""
+
+    def test_anova_boxplot_summary_reports_full_results(self, sample_anova_groups):
+        result = ANOVATool().execute({"groups": sample_anova_groups})
+
+        response = SimplifiedVisualizationResponse(result, "anova_boxplot").generate_response()
+        summary = response["text_summary"]
+
+        assert summary.startswith("One-Way ANOVA Analysis")
+        anova = result["anova_results"]
+        assert (
+            f"Degrees of Freedom: {anova['df_between']} between, {anova['df_within']} within"
+            in summary
+        )
+        for group_name, stats in result["group_statistics"].items():
+            assert f"{group_name}: Mean={stats['mean']:.3f}" in summary
+            assert f"n={stats['size']}" in summary